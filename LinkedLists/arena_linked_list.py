@@ -0,0 +1,245 @@
+from array import array
+
+NIL = -1  # "null pointer" for slot indices
+
+
+class ArenaLinkedList:
+    """Singly linked list with the LinkedList API, stored as a struct of arrays.
+
+    There are no Node objects: slot i of the arena holds values[i] and next[i],
+    where next is a typed array of slot indices (NIL marks the end). Deleted
+    slots are chained into a free list (through next) and reused by later
+    inserts, so the arrays only grow when every slot is in use.
+
+    With a typecode (e.g. "q" or "d") the values live unboxed in a typed array
+    too, and a node costs 12 bytes instead of a full Python object.
+    """
+
+    def __init__(self, typecode: str = None):
+        self.typecode = typecode
+        self.values = array(typecode) if typecode else []
+        self.next = array("i")  # 4-byte indices: up to 2**31 - 1 slots
+        self.head = NIL
+        self.tail = NIL
+        self.size = 0
+        self.free = NIL  # first slot of the free list
+
+    # -- helper: _allocate, _release, _node_at(index), _is_empty, _is_valid_index(index)
+    def _allocate(self, value, next_slot: int) -> int:
+        """Return a slot holding (value, next_slot), reusing a freed slot if any"""
+        if self.free != NIL:
+            slot = self.free
+            self.free = self.next[slot]
+            self.values[slot] = value
+            self.next[slot] = next_slot
+        else:
+            slot = len(self.next)
+            self.values.append(value)
+            self.next.append(next_slot)
+        return slot
+
+    def _release(self, slot: int) -> None:
+        """Push a slot onto the free list"""
+        if self.typecode is None:
+            self.values[slot] = None  # drop the reference to the value
+        self.next[slot] = self.free
+        self.free = slot
+
+    def _is_valid_index(self, index) -> bool:
+        return 0 <= index < self.size
+
+    def _node_at(self, index) -> int:
+        assert self._is_valid_index(index)
+
+        current = self.head
+        next_slots = self.next
+        for _ in range(index):
+            current = next_slots[current]
+
+        return current
+
+    def _is_empty(self):
+        return self.size == 0
+
+    # -- define CRUD operations: prepend, append, insert_at, delete_first, delete_last, delete_at, find
+    def prepend(self, value):
+        new_slot = self._allocate(value, self.head)
+        self.head = new_slot
+
+        if self._is_empty():
+            self.tail = new_slot
+
+        self.size += 1
+
+    def append(self, value):
+        new_slot = self._allocate(value, NIL)
+        if self._is_empty():
+            self.head = self.tail = new_slot
+        else:
+            self.next[self.tail] = new_slot
+            self.tail = new_slot
+
+        self.size += 1
+
+    def insert_at(self, value, index):
+        if index == 0:
+            self.prepend(value)
+        elif index == self.size:
+            self.append(value)
+        else:
+            assert self._is_valid_index(index)
+
+            prev_slot = self._node_at(index - 1)
+            new_slot = self._allocate(value, self.next[prev_slot])
+            self.next[prev_slot] = new_slot
+            self.size += 1
+
+    def delete_first(self):
+        if self._is_empty():
+            return -1
+
+        old_head = self.head
+        if self.size == 1:
+            self.head = NIL
+            self.tail = NIL
+        else:
+            self.head = self.next[old_head]
+
+        self._release(old_head)
+        self.size -= 1
+
+    def delete_last(self):
+        if self._is_empty():
+            return -1
+
+        old_tail = self.tail
+        if self.size == 1:
+            self.head = NIL
+            self.tail = NIL
+        else:
+            self.tail = self._node_at(self.size - 2)
+            self.next[self.tail] = NIL
+
+        self._release(old_tail)
+        self.size -= 1
+
+    def delete_at(self, index):
+        assert self._is_valid_index(index)
+
+        if index == 0:
+            self.delete_first()
+        elif index == (self.size - 1):
+            self.delete_last()
+        else:
+            prev_slot = self._node_at(index - 1)
+            current_slot = self.next[prev_slot]
+            self.next[prev_slot] = self.next[current_slot]
+            self._release(current_slot)
+            self.size -= 1
+
+    def find(self, value) -> int:
+        current = self.head
+        values, next_slots = self.values, self.next
+        for idx in range(self.size):
+            if values[current] == value:
+                return idx
+            current = next_slots[current]
+        return -1
+
+    # -- reverse, merge sorted linked lists
+    def reverse(self):
+        if self._is_empty():
+            raise ValueError("Cannot reverse an empty linked list.")
+        elif self.size == 1:
+            pass
+        else:
+            next_slots = self.next
+            prev_slot = NIL
+            current = self.head
+
+            while current != NIL:
+                next_slot = next_slots[current]
+                next_slots[current] = prev_slot
+                prev_slot = current
+                current = next_slot
+
+            self.tail = self.head
+            self.head = prev_slot
+
+    @staticmethod
+    def merge_sorted(l1, l2):
+        """Merge two sorted ArenaLinkedList instances into a new sorted one"""
+        merged = ArenaLinkedList(l1.typecode)
+        slot_1, slot_2 = l1.head, l2.head
+        while (slot_1 != NIL) or (slot_2 != NIL):
+            if (slot_2 == NIL) or (
+                slot_1 != NIL and l1.values[slot_1] <= l2.values[slot_2]
+            ):
+                merged.append(l1.values[slot_1])
+                slot_1 = l1.next[slot_1]
+            else:
+                merged.append(l2.values[slot_2])
+                slot_2 = l2.next[slot_2]
+        return merged
+
+    # -- syntactic sugar : __len__, __iter__, __str__
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self):
+        current = self.head
+        values, next_slots = self.values, self.next
+        while current != NIL:
+            yield values[current]
+            current = next_slots[current]
+
+    def __str__(self) -> str:
+        return " --> ".join(str(value) for value in self)
+
+
+def main():
+    import time
+    import tracemalloc
+
+    from singly_linked_lists import LinkedList
+
+    ll = ArenaLinkedList()
+    ll.prepend(1)
+    ll.append(5)
+    ll.append(10)
+    ll.prepend(2)
+    ll.insert_at(100, 2)
+    print(ll)
+    ll.delete_at(1)
+    ll.append(7)  # reuses the freed slot
+    print(ll, "| slots allocated:", len(ll.next))
+    ll.reverse()
+    print(ll)
+
+    # -- memory benchmark: object-per-node vs struct-of-arrays
+    count = 500_000
+    for name, factory in (
+        ("LinkedList (Node objects)", LinkedList),
+        ("ArenaLinkedList (list values)", ArenaLinkedList),
+        ("ArenaLinkedList (typecode 'q')", lambda: ArenaLinkedList("q")),
+    ):
+        tracemalloc.start()
+        linked_list = factory()
+        for value in range(count):
+            linked_list.append(value * 1000)  # values above the small-int cache
+        memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        start = time.perf_counter()
+        total = sum(linked_list)
+        elapsed = time.perf_counter() - start
+        print(
+            f"{name:<32} {memory / count:6.1f} bytes/element, "
+            f"traversal {elapsed * 1000:6.1f} ms (sum {total})"
+        )
+        del linked_list
+
+
+if __name__ == "__main__":
+    main()
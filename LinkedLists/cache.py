@@ -0,0 +1,369 @@
+import functools
+import threading
+import time
+from contextlib import nullcontext
+
+from doubly_linked_lists import LinkedList
+
+_MISSING = object()  # get() default that cannot be a cached value
+_KWARGS_MARK = object()  # separates positional from keyword arguments in memoize keys
+
+
+class Entry:
+    """What a cache node holds: the key (for eviction), the value and bookkeeping"""
+
+    def __init__(self, key, value, weight=1, expires_at=None, frequency=1):
+        self.key = key
+        self.value = value
+        self.weight = weight
+        self.expires_at = expires_at
+        self.frequency = frequency
+
+
+class LRUCache:
+    """Bounded cache that evicts the least recently used entry.
+
+    A dict maps each key to its node in a doubly LinkedList kept in recency
+    order (head = least recent), so get, put and eviction are all O(1).
+
+    Limits: maxsize entries and / or maxweight total weight, where
+    weigher(key, value) gives an entry's weight (1 by default). ttl (seconds)
+    makes entries expire; expired entries are dropped lazily, when looked up.
+    With thread_safe=True every operation holds one lock (ShardedCache stripes it).
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 128,
+        maxweight: int = None,
+        weigher=None,
+        ttl: float = None,
+        thread_safe: bool = True,
+        clock=time.monotonic,
+    ):
+        self.maxsize = maxsize
+        self.maxweight = maxweight
+        self.weigher = weigher
+        self.ttl = ttl
+        self.clock = clock
+        self._lock = threading.Lock() if thread_safe else nullcontext()
+
+        self._nodes = {}  # key -> node holding its Entry
+        self._order = LinkedList()  # recency order, least recent first
+        self.weight = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    # -- policy hooks (LFUCache overrides these): where entries live, which goes first
+
+    def _link(self, entry: Entry):
+        """Add an entry as the most recently used; returns its node"""
+        return self._order.append_node(entry)
+
+    def _unlink(self, node) -> None:
+        self._order.remove_node(node)
+
+    def _touch(self, node) -> None:
+        """Record a hit: the node becomes the most recently used"""
+        self._order.move_to_end(node)
+
+    def _victim(self):
+        return self._order.head
+
+    # -- helpers
+
+    def _remove(self, node) -> None:
+        entry = node.value
+        self._unlink(node)
+        del self._nodes[entry.key]
+        self.weight -= entry.weight
+
+    def _is_expired(self, entry: Entry) -> bool:
+        return (entry.expires_at is not None) and (entry.expires_at <= self.clock())
+
+    def _over_limit(self, extra_weight: int) -> bool:
+        """Would adding one entry of extra_weight break a limit?"""
+        if (self.maxsize is not None) and (len(self._nodes) + 1 > self.maxsize):
+            return True
+        return (self.maxweight is not None) and (
+            self.weight + extra_weight > self.maxweight
+        )
+
+    # -- public API: get, put, delete, clear, stats
+
+    def get(self, key, default=None):
+        with self._lock:
+            node = self._nodes.get(key)
+            if node is None:
+                self.misses += 1
+                return default
+
+            entry = node.value
+            if self._is_expired(entry):
+                self._remove(node)
+                self.expirations += 1
+                self.misses += 1
+                return default
+
+            self.hits += 1
+            self._touch(node)
+            return entry.value
+
+    def put(self, key, value) -> None:
+        weight = 1 if self.weigher is None else self.weigher(key, value)
+        expires_at = None if self.ttl is None else self.clock() + self.ttl
+
+        with self._lock:
+            frequency = 1
+            node = self._nodes.get(key)
+            if node is not None:  # an update replaces the entry but keeps its count
+                frequency = node.value.frequency
+                self._remove(node)
+
+            if (self.maxsize == 0) or (
+                (self.maxweight is not None) and (weight > self.maxweight)
+            ):
+                return None  # would never fit
+
+            # evict before linking, so the new entry is never its own victim
+            while self._nodes and self._over_limit(weight):
+                self._remove(self._victim())
+                self.evictions += 1
+
+            entry = Entry(key, value, weight, expires_at, frequency)
+            self._nodes[key] = self._link(entry)
+            self.weight += weight
+        return None
+
+    def delete(self, key) -> None:
+        with self._lock:
+            node = self._nodes.get(key)
+            if node is None:
+                raise KeyError(key)
+            self._remove(node)
+
+    def clear(self) -> None:
+        with self._lock:
+            for node in list(self._nodes.values()):
+                self._remove(node)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "size": len(self._nodes),
+            "weight": self.weight,
+        }
+
+    # -- Pythonic methods
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def __contains__(self, key) -> bool:
+        """Membership test; does not count as a hit or refresh the entry"""
+        with self._lock:
+            node = self._nodes.get(key)
+            return (node is not None) and not self._is_expired(node.value)
+
+
+class LFUCache(LRUCache):
+    """Bounded cache that evicts the least frequently used entry (LRU among ties).
+
+    Entries live in one LinkedList per hit count ("frequency bucket"); a hit
+    moves an entry to the tail of the next bucket, and the victim is the head
+    of the lowest bucket - O(1) for get and put. Only removing the last entry
+    of the lowest bucket other than by a hit rescans the bucket counts.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._buckets = {}  # frequency -> LinkedList of nodes, least recent first
+        self._min_frequency = 0
+
+    def _link(self, entry: Entry):
+        bucket = self._buckets.get(entry.frequency)
+        if bucket is None:
+            bucket = self._buckets[entry.frequency] = LinkedList()
+        if (self._min_frequency == 0) or (entry.frequency < self._min_frequency):
+            self._min_frequency = entry.frequency
+        return bucket.append_node(entry)
+
+    def _drop_from_bucket(self, node) -> bool:
+        """Unlink node from its bucket; True if that emptied the lowest bucket"""
+        frequency = node.value.frequency
+        bucket = self._buckets[frequency]
+        bucket.remove_node(node)
+        if len(bucket):
+            return False
+        del self._buckets[frequency]
+        return frequency == self._min_frequency
+
+    def _unlink(self, node) -> None:
+        if self._drop_from_bucket(node):
+            self._min_frequency = min(self._buckets, default=0)
+
+    def _touch(self, node) -> None:
+        """Move the entry to the tail of the next bucket (a node of that list)"""
+        entry = node.value
+        if self._drop_from_bucket(node):
+            self._min_frequency = entry.frequency + 1  # where the entry is going
+        entry.frequency += 1
+        self._nodes[entry.key] = self._link(entry)
+
+    def _victim(self):
+        return self._buckets[self._min_frequency].head
+
+
+class ShardedCache:
+    """Lock striping: keys are spread over independent caches with a lock each.
+
+    Threads working on different shards never wait for each other. The price
+    is that eviction order (and each limit) is per shard, not global: the limits
+    are split as evenly as possible, with at least 1 per shard.
+    """
+
+    def __init__(
+        self,
+        shards: int = 8,
+        cache_class=LRUCache,
+        maxsize: int = 128,
+        maxweight: int = None,
+        **options,
+    ):
+        if shards < 1:
+            raise ValueError("shards must be at least 1.")
+
+        def share(limit, shard: int):
+            """Shard's part of limit: the first limit % shards shards get one more"""
+            if limit is None:
+                return None
+            return max(1, limit // shards + (shard < limit % shards))
+
+        self._shards = [
+            cache_class(
+                maxsize=share(maxsize, shard),
+                maxweight=share(maxweight, shard),
+                **options,
+            )
+            for shard in range(shards)
+        ]
+
+    def _shard(self, key) -> LRUCache:
+        return self._shards[hash(key) % len(self._shards)]
+
+    def get(self, key, default=None):
+        return self._shard(key).get(key, default)
+
+    def put(self, key, value) -> None:
+        return self._shard(key).put(key, value)
+
+    def delete(self, key) -> None:
+        return self._shard(key).delete(key)
+
+    def clear(self) -> None:
+        for shard in self._shards:
+            shard.clear()
+
+    def stats(self) -> dict:
+        totals = {}
+        for shard in self._shards:
+            for name, count in shard.stats().items():
+                totals[name] = totals.get(name, 0) + count
+        lookups = totals["hits"] + totals["misses"]
+        totals["hit_rate"] = totals["hits"] / lookups if lookups else 0.0
+        return totals
+
+    def __len__(self):
+        return sum(len(shard) for shard in self._shards)
+
+    def __contains__(self, key) -> bool:
+        return key in self._shard(key)
+
+
+def memoize(function=None, *, cache=None, **options):
+    """Memoization decorator backed by a bounded cache.
+
+    @memoize uses an LRUCache(); @memoize(maxsize=..., ttl=...) passes the
+    options to LRUCache, and @memoize(cache=...) uses any cache with get / put
+    (LFUCache, ShardedCache, ...). The cache is exposed as wrapper.cache.
+    Arguments must be hashable. Concurrent misses on one key may both compute.
+    """
+
+    def decorator(function):
+        store = cache if cache is not None else LRUCache(**options)
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            key = args
+            if kwargs:
+                key += (_KWARGS_MARK,) + tuple(sorted(kwargs.items()))
+            result = store.get(key, _MISSING)
+            if result is _MISSING:
+                result = function(*args, **kwargs)  # computed outside the lock
+                store.put(key, result)
+            return result
+
+        wrapper.cache = store
+        return wrapper
+
+    if function is not None:
+        return decorator(function)
+    return decorator
+
+
+def main():
+    import random
+
+    lru = LRUCache(maxsize=3)
+    for key in "abc":
+        lru.put(key, key.upper())
+    lru.get("a")  # "b" is now the least recently used
+    lru.put("d", "D")
+    print("LRU keys after adding d:", [entry.key for entry in lru._order], lru.stats())
+
+    lfu = LFUCache(maxsize=3)
+    for key in "abc":
+        lfu.put(key, key.upper())
+    for _ in range(3):
+        lfu.get("a")
+    lfu.get("b")
+    lfu.put("d", "D")  # "c" has the fewest hits
+    print("LFU contains c:", "c" in lfu, "| contains a:", "a" in lfu)
+
+    # -- weights: cap the total length of cached strings
+    by_length = LRUCache(
+        maxsize=None, maxweight=10, weigher=lambda key, value: len(value)
+    )
+    for word in ("alpha", "beta", "gamma", "pi"):
+        by_length.put(word, word)
+    print("By weight:", [entry.key for entry in by_length._order], by_length.stats())
+
+    # -- memoization of a hot recursive function, with bounded memory
+    @memoize(maxsize=256)
+    def fibonacci(n):
+        return n if n <= 1 else fibonacci(n - 1) + fibonacci(n - 2)
+
+    print("Fibonacci(200):", fibonacci(200), fibonacci.cache.stats())
+
+    # -- skewed (Zipf-like) workload: LRU vs LFU vs sharded LRU hit rates
+    keys = [int(random.paretovariate(1.2)) for _ in range(50_000)]
+    for name, cache in (
+        ("LRUCache", LRUCache(maxsize=100)),
+        ("LFUCache", LFUCache(maxsize=100)),
+        ("ShardedCache", ShardedCache(shards=4, maxsize=100)),
+    ):
+        for key in keys:
+            if cache.get(key, _MISSING) is _MISSING:
+                cache.put(key, key)
+        print(f"{name:<13} hit rate: {cache.stats()['hit_rate']:.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -102,4 +102,5 @@ def main():
     print("Iterate:", list(cll))
 
 
-main()
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,9 @@ string forward(int steps) Move steps forward in history. If you can only forward
 
 """
 
+from ring_buffer import RingBuffer
+
+
 class Node:
     def __init__(self, value, prev=None, next=None):
         self.value = value
@@ -54,6 +57,121 @@ class BrowserHistory:
         return self.current_page.value
 
 
+class ArrayBrowserHistory:
+    """BrowserHistory on an array: back / forward are index arithmetic, O(1) for any steps.
+
+    Pages live in a RingBuffer, oldest first, and _current is an index into it.
+    visit truncates the forward pages (one slice assignment) and appends. With
+    max_pages the buffer is a fixed window that overwrites the oldest page once
+    full, bounding memory.
+    """
+
+    def __init__(self, homepage: str, max_pages: int = None):
+        if max_pages is None:
+            self._pages = RingBuffer()
+        else:
+            self._pages = RingBuffer(capacity=max_pages, overwrite=True)
+        self._pages.append(homepage)
+        self._current = 0
+
+    @property
+    def current_page(self) -> str:
+        return self._pages[self._current]
+
+    def visit(self, url: str) -> None:
+        pages = self._pages
+        pages.truncate(self._current + 1)  # clear forward history
+        pages.append(url)
+        self._current = len(pages) - 1
+
+    def back(self, steps: int) -> str:
+        self._current = max(0, self._current - max(steps, 0))  # negative: no-op
+        return self._pages[self._current]
+
+    def forward(self, steps: int) -> str:
+        self._current = min(len(self._pages) - 1, self._current + max(steps, 0))
+        return self._pages[self._current]
+
+    def replay(self, events) -> str:
+        """Apply (action, argument) events in one call; returns the final page.
+
+        Actions are "visit" (argument: url), "back" and "forward" (argument:
+        steps). Same result as calling the methods one by one, with the
+        per-event work inlined.
+        """
+        pages = self._pages
+        current = self._current
+        for action, argument in events:
+            if action == "visit":
+                pages.truncate(current + 1)
+                pages.append(argument)
+                current = len(pages) - 1
+            elif action == "back":
+                current = max(0, current - max(argument, 0))
+            elif action == "forward":
+                current = min(len(pages) - 1, current + max(argument, 0))
+            else:
+                raise ValueError(f"Unknown browser history action: {action!r}")
+        self._current = current
+        return pages[current]
+
+    @staticmethod
+    def read_log(path: str):
+        """Yield events from a log file of "visit <url>" / "back <n>" / "forward <n>" lines"""
+        with open(path) as file:
+            for line in file:
+                action, _, argument = line.strip().partition(" ")
+                if action == "visit":
+                    yield action, argument
+                elif action:
+                    yield action, int(argument)
+
+
+def main():
+    import os
+    import random
+    import tempfile
+    import time
+
+    history = ArrayBrowserHistory("leetcode.com", max_pages=3)
+    for url in ("google.com", "facebook.com", "youtube.com"):
+        history.visit(url)
+    print(history.back(10_000))  # leetcode.com was evicted by the cap
+    print(history.forward(1))
+    history.visit("linkedin.com")
+    print(history.forward(2), "|", history.back(2))
+
+    # -- replay a session log (long back / forward jumps) against both implementations
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "session.log")
+        with open(path, "w") as file:
+            for event in range(100_000):
+                action = random.choices(("visit", "back", "forward"), (98, 1, 1))[0]
+                if action == "visit":
+                    file.write(f"visit page-{event}.com\n")
+                else:
+                    file.write(f"{action} {random.randint(1, 20_000)}\n")
+        events = list(ArrayBrowserHistory.read_log(path))
+
+    for name, history in (
+        ("BrowserHistory", BrowserHistory("home.com")),
+        ("ArrayBrowserHistory", ArrayBrowserHistory("home.com")),
+    ):
+        start = time.perf_counter()
+        if isinstance(history, ArrayBrowserHistory):
+            final = history.replay(events)
+        else:
+            for action, argument in events:
+                getattr(history, action)(argument)
+            final = history.current_page.value
+        elapsed = time.perf_counter() - start
+        print(f"{name:<20} replay: {elapsed * 1000:7.1f} ms, final page {final}")
+
+
+if __name__ == "__main__":
+    main()
+
+
 # Your BrowserHistory object will be instantiated and called as such:
 # obj = BrowserHistory(homepage)
 # obj.visit(url)
@@ -5,11 +5,19 @@ class Node:
         self.prev = prev
 
 
+def _identity(value):
+    return value
+
+
 class LinkedList:
-    def __init__(self):
+    def __init__(self, indexed: bool = False):
         self.head = None
         self.tail = None
         self.size = 0
+        self._finger = None  # last node reached by _node_at ...
+        self._finger_index = -1  # ... and its position
+        # indexed mode: value -> {node: None} (insertion-ordered set of nodes)
+        self._index = {} if indexed else None
 
     # -- helper functions
 
@@ -20,44 +28,101 @@ class LinkedList:
         return 0 <= index < self.size
 
     def _node_at(self, index: int) -> Node:
-        if self._is_empty():
-            return None
-        elif self._is_valid_index(index):
-            if index <= self.size / 2:  # closer from head
-                current_node = self.head
-                for _ in range(index):
-                    current_node = current_node.next
-                return current_node
-            else:  # closer from tail
-                current_node = self.tail
-                for _ in range(self.size - index - 1):
-                    current_node = current_node.prev
-                return current_node
-        else:
+        """Walk from the nearest of head, tail and finger; the node becomes the finger"""
+        if not self._is_valid_index(index):
             return None
 
-    # -- CRUD operations
-    def prepend(self, value: int) -> None:
-        new_node = Node(value, None, self.head)
-        if self._is_empty():
+        if index <= self.size / 2:  # closer from head
+            current_node, position = self.head, 0
+        else:  # closer from tail
+            current_node, position = self.tail, self.size - 1
+        if (self._finger is not None) and (
+            abs(index - self._finger_index) < abs(index - position)
+        ):
+            current_node, position = self._finger, self._finger_index
+
+        while position < index:
+            current_node = current_node.next
+            position += 1
+        while position > index:
+            current_node = current_node.prev
+            position -= 1
+
+        self._finger, self._finger_index = current_node, index
+        return current_node
+
+    def _link_before(self, next_node: Node, value, index: int) -> Node:
+        """Link a new node in before next_node (None: after the tail), at position index"""
+        prev_node = self.tail if next_node is None else next_node.prev
+        new_node = Node(value, prev_node, next_node)
+        if prev_node is None:
             self.head = new_node
+        else:
+            prev_node.next = new_node
+        if next_node is None:
             self.tail = new_node
         else:
-            self.head.prev = new_node
-            self.head = new_node
+            next_node.prev = new_node
 
         self.size += 1
+        if (self._finger is not None) and (self._finger_index >= index):
+            self._finger_index += 1
+        self._index_node(new_node)
+        return new_node
 
-    def append(self, value: int) -> None:
-        new_node = Node(value, self.tail, None)
-        if self._is_empty():
-            self.head = new_node
-            self.tail = new_node
+    def _unlink(self, node: Node, index: int) -> None:
+        """Remove node, which sits at position index"""
+        self._unindex_node(node)
+        if node.prev is None:
+            self.head = node.next
         else:
-            self.tail.next = new_node
-            self.tail = new_node
+            node.prev.next = node.next
+        if node.next is None:
+            self.tail = node.prev
+        else:
+            node.next.prev = node.prev
 
-        self.size += 1
+        self.size -= 1
+        if self._finger is node:  # keep the finger on a neighbour
+            if node.next is not None:
+                self._finger = node.next
+            else:
+                self._finger, self._finger_index = node.prev, index - 1
+        elif (self._finger is not None) and (self._finger_index > index):
+            self._finger_index -= 1
+
+    def _index_node(self, node: Node) -> None:
+        if self._index is not None:
+            self._index.setdefault(node.value, {})[node] = None
+
+    def _unindex_node(self, node: Node) -> None:
+        if self._index is not None:
+            nodes = self._index[node.value]
+            del nodes[node]
+            if not nodes:
+                del self._index[node.value]
+
+    def _clear(self) -> None:
+        self.head = self.tail = self._finger = None
+        self.size = 0
+        if self._index is not None:
+            self._index = {}
+
+    def _nodes(self, first: Node, stop: Node = None):
+        """Yield the nodes from first up to (not including) stop"""
+        while first is not stop:
+            yield first
+            first = first.next
+
+    def cursor(self, index: int = 0) -> "Cursor":
+        return Cursor(self, index)
+
+    # -- CRUD operations
+    def prepend(self, value: int) -> None:
+        self._link_before(self.head, value, 0)
+
+    def append(self, value: int) -> None:
+        self._link_before(None, value, self.size)
 
     def insert_at(self, index: int, value: int) -> None:
         if index == 0:
@@ -65,39 +130,19 @@ class LinkedList:
         elif index == self.size:
             self.append(value)
         elif self._is_valid_index(index):
-            current_node = self._node_at(index)
-            prev_node = current_node.prev
-            new_node = Node(value, prev_node, current_node)
-            current_node.prev = new_node
-            prev_node.next = new_node
-            self.size += 1
-
+            self._link_before(self._node_at(index), value, index)
         else:
             raise IndexError("Index out of range.")
 
     def delete_first(self) -> None:
         if self._is_empty():
             raise IndexError("Cannot delete from an empty list.")
-        elif self.size == 1:
-            self.head = None
-            self.tail = None
-        else:
-            self.head = self.head.next
-            self.head.prev = None
-
-        self.size -= 1
+        self._unlink(self.head, 0)
 
     def delete_end(self) -> None:
         if self._is_empty():
             raise ValueError("Cannot delete from an empty list.")
-        elif self.size == 1:
-            self.head = None
-            self.tail = None
-        else:
-            self.tail = self.tail.prev
-            self.tail.next = None
-
-        self.size -= 1
+        self._unlink(self.tail, self.size - 1)
 
     def delete_at(self, index) -> None:
         if index == 0:
@@ -105,21 +150,185 @@ class LinkedList:
         elif index == self.size - 1:
             self.delete_end()
         elif self._is_valid_index(index):
-            current_node = self._node_at(index)
-            prev_node = current_node.prev
-            next_node = current_node.next
-            prev_node.next = next_node
-            next_node.prev = prev_node
-            self.size -= 1
+            self._unlink(self._node_at(index), index)
         else:
             assert False
 
+    def find(self, value) -> int:
+        if (self._index is not None) and (value not in self._index):
+            return -1  # a miss costs O(1); a hit still walks to count the position
+
+        for index, element in enumerate(self):
+            if element == value:
+                return index
+        return -1
+
+    def contains(self, value) -> bool:
+        if self._index is not None:
+            return value in self._index
+        return self.find(value) != -1
+
+    def remove(self, value) -> None:
+        """Delete a node holding value: the first one, or any one if indexed"""
+        if self._index is not None:
+            if value not in self._index:
+                raise ValueError("Value not in linked list.")
+            self.remove_node(next(iter(self._index[value])))
+        else:
+            node, index = self.head, 0
+            while node and node.value != value:
+                node, index = node.next, index + 1
+            if node is None:
+                raise ValueError("Value not in linked list.")
+            self._unlink(node, index)
+
+    # -- node handles: O(1) removal for callers that keep the node (e.g. caches)
+
+    def append_node(self, value) -> Node:
+        """Append value and return its node, to pass to remove_node later"""
+        return self._link_before(None, value, self.size)
+
+    def remove_node(self, node: Node) -> None:
+        """Unlink a node of this list in O(1); its position is unknown, so the
+        finger is dropped unless it points at the node"""
+        if self._finger is not node:
+            self._finger = None
+        self._unlink(node, self._finger_index)
+
+    def move_to_end(self, node: Node) -> None:
+        """Relink a node of this list after the tail in O(1) - the same node, so
+        handles to it stay valid; the finger is dropped, as in remove_node"""
+        if node is self.tail:
+            return None
+        self._finger = None
+        if node.prev is None:
+            self.head = node.next
+        else:
+            node.prev.next = node.next
+        node.next.prev = node.prev
+
+        node.prev, node.next = self.tail, None
+        self.tail.next = node
+        self.tail = node
+        return None
+
+    # -- Bulk operations: from_iterable, extend, splice, slice, remove_if
+
+    @staticmethod
+    def _chain(iterable):
+        """Link the values into a fresh chain in one pass -> (first, last, count)"""
+        first = last = None
+        count = 0
+        for value in iterable:
+            new_node = Node(value, last, None)
+            if last is None:
+                first = new_node
+            else:
+                last.next = new_node
+            last = new_node
+            count += 1
+        return first, last, count
+
+    @classmethod
+    def from_iterable(cls, iterable, indexed: bool = False) -> "LinkedList":
+        linked_list = cls(indexed)
+        linked_list.extend(iterable)
+        return linked_list
+
+    def extend(self, iterable) -> None:
+        first, last, count = self._chain(iterable)
+        if count == 0:
+            return
+
+        if self._is_empty():
+            self.head = first
+        else:
+            self.tail.next = first
+            first.prev = self.tail
+        self.tail = last
+        self.size += count
+        if self._index is not None:
+            for node in self._nodes(first):
+                self._index_node(node)
+
+    def splice(self, other: "LinkedList", index: int) -> None:
+        """Move all nodes of other in before position index; other ends up empty"""
+        if other is self:
+            raise ValueError("Cannot splice a linked list into itself.")
+        if not 0 <= index <= self.size:
+            raise IndexError("Index out of range.")
+        if other._is_empty():
+            return
+
+        if index == self.size:
+            prev_node, next_node = self.tail, None
+        else:
+            next_node = self._node_at(index)
+            prev_node = next_node.prev
+        if (self._finger is not None) and (self._finger_index >= index):
+            self._finger_index += other.size
+
+        other.head.prev = prev_node
+        other.tail.next = next_node
+        if prev_node is None:
+            self.head = other.head
+        else:
+            prev_node.next = other.head
+        if next_node is None:
+            self.tail = other.tail
+        else:
+            next_node.prev = other.tail
+
+        self.size += other.size
+        if self._index is not None:
+            for node in self._nodes(other.head, next_node):
+                self._index_node(node)
+        other._clear()
+
+    def slice(self, start: int, stop: int) -> "LinkedList":
+        """New LinkedList with the values at positions start..stop-1 (slice rules)"""
+        start, stop, _ = slice(start, stop).indices(self.size)
+        current = self._node_at(start) if start < stop else None
+
+        def values():
+            node = current
+            for _ in range(start, stop):
+                yield node.value
+                node = node.next
+
+        return self.from_iterable(values(), self._index is not None)
+
+    def remove_if(self, predicate) -> int:
+        """Delete every node whose value satisfies predicate; returns how many"""
+        removed = 0
+        self._finger = None
+        current_node = self.head
+        while current_node:
+            next_node = current_node.next
+            if predicate(current_node.value):
+                if current_node.prev is None:
+                    self.head = next_node
+                else:
+                    current_node.prev.next = next_node
+                if next_node is None:
+                    self.tail = current_node.prev
+                else:
+                    next_node.prev = current_node.prev
+                self._unindex_node(current_node)
+                removed += 1
+            current_node = next_node
+
+        self.size -= removed
+        return removed
+
     # -- Reverse and Merge
 
     def reverse(self) -> None:
         if self._is_empty():
             assert False
         else:
+            if self._finger is not None:
+                self._finger_index = self.size - 1 - self._finger_index
             prev_node = None
             current_node = self.head
             self.tail = self.head
@@ -132,15 +341,101 @@ class LinkedList:
 
             self.head = prev_node
 
-    # @staticmethod
-    # def merge(l1 : LinkedList, l2 : LinkedList) -> LinkedList:
-    #     # TODO : Implement merging
-    #     pass
+    @staticmethod
+    def _cut(node: Node, count: int) -> Node:
+        """Detach the chain after the first count nodes starting at node; return the rest"""
+        for _ in range(count - 1):
+            if node is None:
+                return None
+            node = node.next
+        if node is None:
+            return None
+        rest = node.next
+        node.next = None
+        if rest is not None:
+            rest.prev = None
+        return rest
+
+    @staticmethod
+    def _merge_chains(first: Node, second: Node, key, reverse: bool):
+        """Relink two sorted chains into one -> (head, tail); on ties first goes first"""
+        if first is None or second is None:
+            head = tail = first or second
+        else:
+            head = tail = None
+            while first and second:
+                first_key, second_key = key(first.value), key(second.value)
+                if (second_key > first_key) if reverse else (second_key < first_key):
+                    node, second = second, second.next
+                else:
+                    node, first = first, first.next
+                node.prev = tail
+                if tail is None:
+                    head = node
+                else:
+                    tail.next = node
+                tail = node
+            tail.next = first or second
+            tail.next.prev = tail
+
+        while tail and tail.next:
+            tail = tail.next
+        return head, tail
+
+    def sort(self, key=None, reverse: bool = False) -> None:
+        """Stable bottom-up merge sort that relinks the nodes: O(n log n), O(1) memory"""
+        if self.size < 2:
+            return None
+        if key is None:
+            key = _identity
+
+        self._finger = None
+        width = 1
+        while width < self.size:
+            head = tail = None
+            current_node = self.head
+            while current_node:
+                first = current_node
+                second = self._cut(first, width)
+                current_node = self._cut(second, width)
+                merged_head, merged_tail = self._merge_chains(
+                    first, second, key, reverse
+                )
+                merged_head.prev = tail
+                if tail is None:
+                    head = merged_head
+                else:
+                    tail.next = merged_head
+                tail = merged_tail
+            self.head, self.tail = head, tail
+            width *= 2
+        return None
+
+    @staticmethod
+    def merge(
+        l1: "LinkedList", l2: "LinkedList", key=None, reverse: bool = False
+    ) -> "LinkedList":
+        """Merge two sorted lists by relinking their nodes; l1 and l2 are left empty"""
+        merged = LinkedList(l1._index is not None)
+        merged.head, merged.tail = LinkedList._merge_chains(
+            l1.head, l2.head, key or _identity, reverse
+        )
+        merged.size = l1.size + l2.size
+        if merged._index is not None:
+            for node in merged._nodes(merged.head):
+                merged._index_node(node)
+
+        l1._clear()
+        l2._clear()
+        return merged
 
     # -- Pythonic methods
     def __len__(self):
         return self.size
 
+    def __contains__(self, value) -> bool:
+        return self.contains(value)
+
     def __iter__(self):
         current_node = self.head
         while current_node:
@@ -157,6 +452,69 @@ class LinkedList:
         return output
 
 
+class Cursor:
+    """A position in a LinkedList: O(1) moves, reads, inserts and deletes.
+
+    The cursor is on a node (index 0..size-1) or just past the tail (index == size).
+    Edits made through the cursor keep the list (and its finger) consistent;
+    edits made any other way leave the cursor stale, as with any iterator.
+    """
+
+    def __init__(self, linked_list: LinkedList, index: int = 0):
+        if not 0 <= index <= linked_list.size:
+            raise IndexError("Index out of range.")
+        self._list = linked_list
+        self.index = index
+        self.node = linked_list._node_at(index)  # None past the tail
+
+    def at_end(self) -> bool:
+        return self.node is None
+
+    @property
+    def value(self):
+        if self.node is None:
+            raise IndexError("Cursor is past the end of the list.")
+        return self.node.value
+
+    @value.setter
+    def value(self, value) -> None:
+        if self.node is None:
+            raise IndexError("Cursor is past the end of the list.")
+        self._list._unindex_node(self.node)
+        self.node.value = value
+        self._list._index_node(self.node)
+
+    def move_next(self) -> None:
+        if self.node is None:
+            raise IndexError("Cursor is past the end of the list.")
+        self.node = self.node.next
+        self.index += 1
+
+    def move_prev(self) -> None:
+        if self.index == 0:
+            raise IndexError("Cursor is at the start of the list.")
+        self.node = self._list.tail if self.node is None else self.node.prev
+        self.index -= 1
+
+    def insert_before(self, value) -> None:
+        """Insert value at the cursor; the cursor stays on its node"""
+        self._list._link_before(self.node, value, self.index)
+        self.index += 1
+
+    def insert_after(self, value) -> None:
+        if self.node is None:
+            raise IndexError("Cursor is past the end of the list.")
+        self._list._link_before(self.node.next, value, self.index + 1)
+
+    def delete(self) -> None:
+        """Delete the node at the cursor and move on to the next one"""
+        if self.node is None:
+            raise IndexError("Cursor is past the end of the list.")
+        next_node = self.node.next
+        self._list._unlink(self.node, self.index)
+        self.node = next_node
+
+
 def main():
     dll = LinkedList()
     for i in range(5):
@@ -166,5 +524,45 @@ def main():
     dll.reverse()
     print(dll)
 
+    dll = LinkedList.from_iterable(range(10))
+    dll.remove_if(lambda value: value % 3 == 0)
+    dll.splice(LinkedList.from_iterable([100, 200]), 2)
+    print(dll)
+    print(dll.slice(1, 4))
+
+    dll.sort(reverse=True)
+    print(dll)
+    merged = LinkedList.merge(
+        LinkedList.from_iterable([1, 4, 9]), LinkedList.from_iterable([2, 3, 10])
+    )
+    print(merged)
+
+    # -- cursor: delete the even values and double the odd ones in one pass
+    cursor = merged.cursor()
+    while not cursor.at_end():
+        if cursor.value % 2 == 0:
+            cursor.delete()
+        else:
+            cursor.insert_after(cursor.value * 2)
+            cursor.move_next()
+            cursor.move_next()
+    print(merged)
+
+    # -- indexed mode: O(1) membership and removal by value
+    merged = LinkedList.from_iterable(merged, indexed=True)
+    merged.remove(6)
+    print(merged, "| contains 9:", 9 in merged, "| contains 6:", 6 in merged)
+
+    # -- sequential index access: O(n) in total thanks to the finger
+    import time
+
+    dll = LinkedList.from_iterable(range(100_000))
+    start = time.perf_counter()
+    for index in range(len(dll)):
+        dll._node_at(index)
+    elapsed = time.perf_counter() - start
+    print(f"Sequential _node_at over {len(dll)} nodes: {elapsed * 1000:.1f} ms")
+
 
-main()
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,343 @@
+import random
+
+MAX_LEVEL = 32  # enough for 2**32 nodes at PROMOTION_PROBABILITY = 0.5
+PROMOTION_PROBABILITY = 0.5
+
+
+class SkipNode:
+    """A node of height h: forward / backward links and spans for levels 0..h-1.
+
+    span[l] is the number of positions between this node and forward[l]
+    (always 1 on level 0). next / prev are the level-0 links, as on Node.
+    """
+
+    def __init__(self, value, height: int):
+        self.value = value
+        self.forward = [None] * height
+        self.backward = [None] * height
+        self.span = [1] * height
+
+    @property
+    def next(self):
+        return self.forward[0]
+
+    @property
+    def prev(self):
+        return self.backward[0]
+
+
+class IndexableLinkedList:
+    """Doubly linked list with O(log n) positional access (indexable skip list).
+
+    Level 0 is an ordinary doubly linked list; each node is also linked into
+    a random number of express levels above it, and every link records how
+    many positions it skips. _node_at, insert_at and delete_at walk down from
+    the top level, adding up spans: O(log n) expected.
+
+    prepend / append / delete_first / delete_end touch only the levels of the
+    node itself (2 on average), so they stay O(1) expected. The spans of the
+    header and the distances from the last node of each level to the tail
+    would otherwise all shift by one; instead they are stored relative to the
+    counters _front_shift and _back_shift, which move all of them at once.
+    """
+
+    def __init__(self):
+        self._header = SkipNode(None, MAX_LEVEL)  # sentinel at position -1
+        self._front_shift = 0  # real header span = stored span + _front_shift
+        self._last = [self._header] * MAX_LEVEL  # last node on each level
+        self._gap = [0] * MAX_LEVEL  # tail distance of _last[l], minus _back_shift
+        self._back_shift = 0
+        self._level = 1  # levels in use
+        self.size = 0
+
+    # -- helper functions
+
+    def _is_empty(self) -> bool:
+        return self.size == 0
+
+    def _is_valid_index(self, index: int) -> bool:
+        return 0 <= index < self.size
+
+    @staticmethod
+    def _random_height() -> int:
+        height = 1
+        while (height < MAX_LEVEL) and (random.random() < PROMOTION_PROBABILITY):
+            height += 1
+        return height
+
+    def _raise_level(self, height: int) -> None:
+        """Start using levels up to height (they begin empty)"""
+        for level in range(self._level, height):
+            self._header.forward[level] = None
+            self._last[level] = self._header
+        self._level = max(self._level, height)
+
+    def _get_span(self, node: SkipNode, level: int) -> int:
+        if node is self._header:
+            return node.span[level] + self._front_shift
+        return node.span[level]
+
+    def _set_span(self, node: SkipNode, level: int, span: int) -> None:
+        if node is self._header:
+            span -= self._front_shift
+        node.span[level] = span
+
+    def _get_gap(self, level: int) -> int:
+        """Positions from _last[level] to the tail"""
+        if self._last[level] is self._header:
+            return self.size
+        return self._gap[level] + self._back_shift
+
+    def _set_gap(self, level: int, gap: int) -> None:
+        self._gap[level] = gap - self._back_shift
+
+    def _predecessors(self, index: int):
+        """For every level, the last node before position index and its position"""
+        update = [self._header] * MAX_LEVEL
+        ranks = [-1] * MAX_LEVEL
+        node, rank = self._header, -1
+        for level in range(self._level - 1, -1, -1):
+            while (node.forward[level] is not None) and (
+                rank + self._get_span(node, level) < index
+            ):
+                rank += self._get_span(node, level)
+                node = node.forward[level]
+            update[level] = node
+            ranks[level] = rank
+        return update, ranks
+
+    def _node_at(self, index: int) -> SkipNode:
+        if not self._is_valid_index(index):
+            return None
+        if index == self.size - 1:
+            return self._last[0]
+
+        node, rank = self._header, -1
+        for level in range(self._level - 1, -1, -1):
+            while (node.forward[level] is not None) and (
+                rank + self._get_span(node, level) <= index
+            ):
+                rank += self._get_span(node, level)
+                node = node.forward[level]
+            if rank == index:
+                break
+        return node
+
+    @property
+    def head(self) -> SkipNode:
+        return self._header.forward[0]
+
+    @property
+    def tail(self) -> SkipNode:
+        return None if self._is_empty() else self._last[0]
+
+    # -- CRUD operations
+    def prepend(self, value) -> None:
+        height = self._random_height()
+        self._raise_level(height)
+        new_node = SkipNode(value, height)
+
+        self._front_shift += 1  # every header span grows by one
+        self.size += 1
+        for level in range(height):
+            first = self._header.forward[level]
+            new_node.forward[level] = first
+            new_node.backward[level] = self._header
+            if first is None:
+                self._last[level] = new_node
+                self._set_gap(level, self.size - 1)
+            else:
+                first.backward[level] = new_node
+                new_node.span[level] = self._get_span(self._header, level) - 1
+            self._header.forward[level] = new_node
+            self._set_span(self._header, level, 1)
+
+    def append(self, value) -> None:
+        height = self._random_height()
+        self._raise_level(height)
+        new_node = SkipNode(value, height)
+
+        self._back_shift += 1  # every tail distance grows by one
+        self.size += 1
+        for level in range(height):
+            last = self._last[level]
+            self._set_span(last, level, self._get_gap(level))
+            last.forward[level] = new_node
+            new_node.backward[level] = last
+            self._last[level] = new_node
+            self._set_gap(level, 0)
+
+    def insert_at(self, index: int, value) -> None:
+        if index == 0:
+            self.prepend(value)
+        elif index == self.size:
+            self.append(value)
+        elif self._is_valid_index(index):
+            update, ranks = self._predecessors(index)
+            height = self._random_height()
+            self._raise_level(height)
+            new_node = SkipNode(value, height)
+
+            self.size += 1
+            for level in range(self._level):
+                pred = update[level]
+                if level < height:
+                    following = pred.forward[level]
+                    new_node.forward[level] = following
+                    new_node.backward[level] = pred
+                    if following is None:
+                        self._last[level] = new_node
+                        self._set_gap(level, self.size - 1 - index)
+                    else:
+                        following.backward[level] = new_node
+                        new_node.span[level] = (
+                            self._get_span(pred, level) + 1 - (index - ranks[level])
+                        )
+                    pred.forward[level] = new_node
+                    self._set_span(pred, level, index - ranks[level])
+                elif pred.forward[level] is not None:
+                    self._set_span(pred, level, self._get_span(pred, level) + 1)
+                elif pred is not self._header:
+                    # pred is the last node on this level; the tail moved away by one
+                    self._gap[level] += 1
+        else:
+            raise IndexError("Index out of range.")
+
+    def delete_first(self) -> None:
+        if self._is_empty():
+            raise IndexError("Cannot delete from an empty list.")
+
+        node = self._header.forward[0]
+        self._front_shift -= 1  # every header span shrinks by one
+        self.size -= 1
+        for level in range(len(node.forward)):
+            following = node.forward[level]
+            self._header.forward[level] = following
+            if following is None:
+                self._last[level] = self._header
+            else:
+                following.backward[level] = self._header
+                self._set_span(self._header, level, node.span[level])
+
+    def delete_end(self) -> None:
+        if self._is_empty():
+            raise ValueError("Cannot delete from an empty list.")
+
+        node = self._last[0]
+        self._back_shift -= 1  # every tail distance shrinks by one
+        self.size -= 1
+        for level in range(len(node.forward)):
+            pred = node.backward[level]
+            pred.forward[level] = None
+            self._last[level] = pred
+            if pred is not self._header:
+                self._set_gap(level, self._get_span(pred, level) - 1)
+
+    def delete_at(self, index: int) -> None:
+        if index == 0:
+            self.delete_first()
+        elif index == self.size - 1:
+            self.delete_end()
+        elif self._is_valid_index(index):
+            update, _ = self._predecessors(index)
+            node = update[0].forward[0]
+
+            for level in range(self._level):
+                pred = update[level]
+                if pred.forward[level] is node:
+                    following = node.forward[level]
+                    pred.forward[level] = following
+                    if following is None:
+                        # node was last on this level - pred takes over its tail distance
+                        tail_distance = self._get_span(pred, level) + self._get_gap(
+                            level
+                        )
+                        self._last[level] = pred
+                        if pred is not self._header:
+                            self._set_gap(level, tail_distance - 1)
+                    else:
+                        following.backward[level] = pred
+                        self._set_span(
+                            pred,
+                            level,
+                            self._get_span(pred, level) + node.span[level] - 1,
+                        )
+                elif pred.forward[level] is not None:
+                    self._set_span(pred, level, self._get_span(pred, level) - 1)
+                elif pred is not self._header:
+                    self._gap[level] -= 1
+            self.size -= 1
+        else:
+            raise IndexError("Index out of range.")
+
+    def find(self, value) -> int:
+        for index, element in enumerate(self):
+            if element == value:
+                return index
+        return -1
+
+    def __getitem__(self, index: int):
+        if index < 0:
+            index += self.size
+        if not self._is_valid_index(index):
+            raise IndexError("Index out of range.")
+        return self._node_at(index).value
+
+    # -- Reverse
+
+    def reverse(self) -> None:
+        """Rebuild the list back to front (new random heights) - O(n) expected"""
+        values = list(self)
+        self.__init__()
+        for value in reversed(values):
+            self.append(value)
+
+    # -- Pythonic methods
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        current_node = self._header.forward[0]
+        while current_node:
+            yield current_node.value
+            current_node = current_node.forward[0]
+
+    def __str__(self):
+        return " <--> ".join(str(value) for value in self)
+
+
+def main():
+    import time
+
+    from doubly_linked_lists import LinkedList
+
+    sl = IndexableLinkedList()
+    for i in range(5):
+        sl.prepend(i)
+        sl.append(100 - i**2)
+    sl.insert_at(3, 42)
+    sl.delete_at(6)
+    print(sl)
+    print("Element at 3:", sl[3])
+
+    # -- random positional edits: doubly LinkedList vs indexable skip list
+    size, edits = 20_000, 5_000
+    positions = [random.randrange(size) for _ in range(edits)]
+    for name, factory in (
+        ("LinkedList", LinkedList),
+        ("IndexableLinkedList", IndexableLinkedList),
+    ):
+        linked_list = factory()
+        for value in range(size):
+            linked_list.append(value)
+
+        start = time.perf_counter()
+        for index in positions:
+            linked_list.insert_at(index, -1)
+            linked_list.delete_at(index + 1)
+        elapsed = time.perf_counter() - start
+        print(f"{name:<20} {edits} insert/delete pairs: {elapsed * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+from singly_linked_lists import Node
+
+
+class PersistentLinkedList:
+    """Immutable singly linked list: every "update" returns a new version.
+
+    Nodes are never modified once linked, so versions share them: prepend
+    makes one node that points at the old head (O(1)), and insert_at /
+    delete_at copy only the nodes before the index. A version is its own
+    snapshot - hand it to a reader and it stays consistent with no copy or
+    lock, and n versions cost memory for their changes, not n full lists.
+    """
+
+    def __init__(self, head: Node = None, size: int = 0):
+        self.head = head
+        self.size = size
+
+    @classmethod
+    def from_iterable(cls, iterable) -> "PersistentLinkedList":
+        head, size = None, 0
+        for value in reversed(list(iterable)):
+            head, size = Node(value, head), size + 1
+        return cls(head, size)
+
+    # -- helpers
+
+    def _is_empty(self) -> bool:
+        return self.size == 0
+
+    def _is_valid_index(self, index: int) -> bool:
+        return 0 <= index < self.size
+
+    def _node_at(self, index: int) -> Node:
+        assert self._is_valid_index(index)
+
+        current = self.head
+        for _ in range(index):
+            current = current.next
+        return current
+
+    def _rebuild(self, index: int, rest: Node, size: int) -> "PersistentLinkedList":
+        """New version: copies of the first index nodes, linked onto the shared rest"""
+        values = []
+        current = self.head
+        for _ in range(index):
+            values.append(current.value)
+            current = current.next
+
+        head = rest
+        for value in reversed(values):
+            head = Node(value, head)
+        return PersistentLinkedList(head, size)
+
+    # -- versions: prepend, delete_first, insert_at, delete_at, reverse
+
+    def prepend(self, value) -> "PersistentLinkedList":
+        return PersistentLinkedList(Node(value, self.head), self.size + 1)
+
+    def delete_first(self) -> "PersistentLinkedList":
+        if self._is_empty():
+            raise IndexError("Cannot delete from an empty list.")
+        return PersistentLinkedList(self.head.next, self.size - 1)
+
+    def insert_at(self, value, index: int) -> "PersistentLinkedList":
+        assert 0 <= index <= self.size
+
+        rest = None if index == self.size else self._node_at(index)
+        return self._rebuild(index, Node(value, rest), self.size + 1)
+
+    def append(self, value) -> "PersistentLinkedList":
+        """O(n): the whole list is copied - prefer prepend"""
+        return self.insert_at(value, self.size)
+
+    def delete_at(self, index: int) -> "PersistentLinkedList":
+        assert self._is_valid_index(index)
+
+        return self._rebuild(index, self._node_at(index).next, self.size - 1)
+
+    def reverse(self) -> "PersistentLinkedList":
+        head = None
+        for value in self:
+            head = Node(value, head)
+        return PersistentLinkedList(head, self.size)
+
+    # -- queries
+
+    @property
+    def first(self):
+        if self._is_empty():
+            raise IndexError("Empty list has no first value.")
+        return self.head.value
+
+    def find(self, value) -> int:
+        for index, element in enumerate(self):
+            if element == value:
+                return index
+        return -1
+
+    # -- syntactic sugar : __len__, __iter__, __str__
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self):
+        current = self.head
+        while current:
+            yield current.value
+            current = current.next
+
+    def __str__(self) -> str:
+        return " --> ".join(str(value) for value in self)
+
+
+EMPTY = PersistentLinkedList()
+
+
+class VersionedBrowserHistory:
+    """BrowserHistory whose every state is an immutable snapshot.
+
+    The state is a zipper: the pages behind the current one (nearest first),
+    the current page and the pages ahead, both as PersistentLinkedLists. visit
+    and each step of back / forward change O(1) nodes, and earlier states stay
+    valid, so snapshot() is O(1) and undo() restores the previous state.
+    """
+
+    def __init__(self, homepage: str):
+        self._state = (EMPTY, homepage, EMPTY)  # (behind, current, ahead)
+        self._versions = []  # earlier states, for undo
+
+    @property
+    def current_page(self) -> str:
+        return self._state[1]
+
+    def _commit(self, state: tuple) -> None:
+        if state != self._state:
+            self._versions.append(self._state)
+            self._state = state
+
+    def visit(self, url: str) -> None:
+        behind, current, _ = self._state
+        self._commit((behind.prepend(current), url, EMPTY))
+
+    def back(self, steps: int) -> str:
+        behind, current, ahead = self._state
+        for _ in range(min(steps, len(behind))):
+            ahead = ahead.prepend(current)
+            current, behind = behind.first, behind.delete_first()
+        self._commit((behind, current, ahead))
+        return current
+
+    def forward(self, steps: int) -> str:
+        behind, current, ahead = self._state
+        for _ in range(min(steps, len(ahead))):
+            behind = behind.prepend(current)
+            current, ahead = ahead.first, ahead.delete_first()
+        self._commit((behind, current, ahead))
+        return current
+
+    # -- versions
+
+    def snapshot(self) -> tuple:
+        """The current state; it never changes, whatever happens to the history"""
+        return self._state
+
+    def restore(self, snapshot: tuple) -> None:
+        self._commit(snapshot)
+
+    def undo(self) -> str:
+        if self._versions:
+            self._state = self._versions.pop()
+        return self.current_page
+
+    def pages(self, snapshot: tuple = None) -> list:
+        """All pages of a state (default: the current one), oldest first"""
+        behind, current, ahead = snapshot or self._state
+        return list(behind.reverse()) + [current] + list(ahead)
+
+
+def main():
+    import tracemalloc
+
+    base = PersistentLinkedList.from_iterable([3, 4, 5])
+    version_1 = base.prepend(2)
+    version_2 = version_1.insert_at(100, 2)
+    version_3 = version_2.delete_first()
+    for name, version in (
+        ("base", base),
+        ("v1", version_1),
+        ("v2", version_2),
+        ("v3", version_3),
+    ):
+        print(f"{name}: {version}")
+    print("v1 shares base's nodes:", version_1.head.next is base.head)
+
+    # -- 1000 versions of a 10,000-element list: memory for the changes only
+    tracemalloc.start()
+    versions = [PersistentLinkedList.from_iterable(range(10_000))]
+    after_first, _ = tracemalloc.get_traced_memory()
+    for value in range(1_000):
+        versions.append(versions[-1].prepend(value))
+    total, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"First version: {after_first / 1024:.0f} KiB, "
+        f"1000 more versions: {(total - after_first) / 1024:.0f} KiB"
+    )
+
+    history = VersionedBrowserHistory("leetcode.com")
+    for url in ("google.com", "facebook.com", "youtube.com"):
+        history.visit(url)
+    saved = history.snapshot()
+    print(history.back(2), "|", history.forward(1))
+    history.visit("linkedin.com")
+    print("Now:", history.pages())
+    print("Snapshot still:", history.pages(saved))
+    history.undo()
+    history.undo()
+    print("After 2 undos:", history.current_page, history.pages())
+
+
+if __name__ == "__main__":
+    main()
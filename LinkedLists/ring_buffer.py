@@ -0,0 +1,217 @@
+from array import array
+
+
+class RingBuffer:
+    """CircularLinkedList API on one circular array: every end operation is O(1).
+
+    The values sit in slots head, head + 1, ... (mod capacity). When the
+    buffer is full, append / prepend either
+      - grow it (growable=True, the default): capacity doubles, amortised O(1),
+      - overwrite the value at the other end (overwrite=True, which fixes the
+        capacity): a window over the latest values, e.g. for telemetry,
+      - or raise IndexError (growable=False).
+
+    With a typecode (e.g. "d" or "q") the values are stored unboxed in a typed
+    array, and view() / segments() export them as memoryviews without copying.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 16,
+        growable: bool = True,
+        overwrite: bool = False,
+        typecode: str = None,
+    ):
+        if capacity < 1:
+            raise ValueError("Capacity must be at least 1.")
+        self.typecode = typecode
+        self.growable = growable and not overwrite  # a window has a fixed size
+        self.overwrite = overwrite
+        self._items = self._allocate(capacity)
+        self.head = 0  # slot of the first value
+        self.size = 0
+
+    # -- helpers
+
+    def _allocate(self, capacity: int):
+        if self.typecode is None:
+            return [None] * capacity
+        return array(self.typecode, [0]) * capacity
+
+    @property
+    def capacity(self) -> int:
+        return len(self._items)
+
+    def is_empty(self) -> bool:
+        return self.size == 0
+
+    def is_full(self) -> bool:
+        return self.size == self.capacity
+
+    def _ordered(self):
+        """The values, first to last, as a new list / array (at most two slice copies)"""
+        end = self.head + self.size
+        if end <= self.capacity:
+            return self._items[self.head : end]
+        return self._items[self.head :] + self._items[: end - self.capacity]
+
+    def _resize(self, capacity: int) -> None:
+        items = self._allocate(capacity)
+        items[: self.size] = self._ordered()
+        self._items = items
+        self.head = 0
+
+    # -- end operations: append, prepend, delete_first, delete_last
+
+    def append(self, value) -> None:
+        if self.is_full():
+            if self.growable:
+                self._resize(2 * self.capacity)
+            elif self.overwrite:  # the slot after the last value is the first one
+                self._items[self.head] = value
+                self.head = (self.head + 1) % self.capacity
+                return None
+            else:
+                raise IndexError("Ring buffer is full.")
+
+        self._items[(self.head + self.size) % self.capacity] = value
+        self.size += 1
+
+    def prepend(self, value) -> None:
+        if self.is_full():
+            if self.growable:
+                self._resize(2 * self.capacity)
+            elif self.overwrite:  # the slot before the first value is the last one
+                self.head = (self.head - 1) % self.capacity
+                self._items[self.head] = value
+                return None
+            else:
+                raise IndexError("Ring buffer is full.")
+
+        self.head = (self.head - 1) % self.capacity
+        self._items[self.head] = value
+        self.size += 1
+
+    def delete_first(self):
+        if self.is_empty():
+            return None
+        removed_value = self._items[self.head]
+        if self.typecode is None:
+            self._items[self.head] = None  # drop the reference
+        self.head = (self.head + 1) % self.capacity
+        self.size -= 1
+        return removed_value
+
+    def delete_last(self):
+        if self.is_empty():
+            return None
+        slot = (self.head + self.size - 1) % self.capacity
+        removed_value = self._items[slot]
+        if self.typecode is None:
+            self._items[slot] = None
+        self.size -= 1
+        return removed_value
+
+    def truncate(self, size: int) -> None:
+        """Keep the first size values, dropping the rest from the end at once"""
+        if not 0 <= size <= self.size:
+            raise ValueError("Can only truncate to a size between 0 and len().")
+        if (self.typecode is None) and (size < self.size):
+            # drop the references: one slice for each of the (at most 2) segments
+            first, last = self.head + size, self.head + self.size
+            capacity = self.capacity
+            for start, stop in ((first, last), (first - capacity, last - capacity)):
+                start, stop = max(start, 0), min(stop, capacity)
+                if start < stop:
+                    self._items[start:stop] = [None] * (stop - start)
+        self.size = size
+
+    # -- zero-copy export (typed arrays only)
+
+    def segments(self) -> tuple:
+        """The values as two memoryviews (the second is empty unless they wrap)"""
+        if self.typecode is None:
+            raise TypeError(
+                "Only a ring buffer with a typecode can export memoryviews."
+            )
+        view = memoryview(self._items)
+        end = self.head + self.size
+        if end <= self.capacity:
+            return view[self.head : end], view[0:0]
+        return view[self.head :], view[: end - self.capacity]
+
+    def view(self) -> memoryview:
+        """The values as one memoryview; wrapped contents are first rotated to slot 0"""
+        first, second = self.segments()
+        if len(second):
+            first.release()
+            second.release()
+            self._resize(self.capacity)
+            first, _ = self.segments()
+        return first
+
+    # -- Pythonic methods
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, index: int):
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("Index out of range.")
+        return self._items[(self.head + index) % self.capacity]
+
+    def __iter__(self):
+        items, capacity = self._items, self.capacity
+        for offset in range(self.head, self.head + self.size):
+            yield items[offset % capacity]
+
+    def __str__(self):
+        if self.is_empty():
+            return ""
+        return " -> ".join(str(value) for value in self) + " (circular)"
+
+
+def main():
+    import time
+
+    from circular_linked_list import CircularLinkedList
+
+    rb = RingBuffer(capacity=4)
+    for i in range(5):
+        rb.append(i)
+    print("Appended:", rb, "| capacity:", rb.capacity)
+    rb.prepend(100)
+    print("Prepended 100:", rb)
+    rb.delete_first()
+    rb.delete_last()
+    print("After delete_first / delete_last:", rb)
+
+    # -- telemetry window: keep the last 5 samples, read them without copying
+    window = RingBuffer(capacity=5, overwrite=True, typecode="d")
+    for sample in range(12):
+        window.append(sample * 0.5)
+    with window.view() as samples:
+        print(
+            "Last 5 samples:", samples.tolist(), "| mean:", sum(samples) / len(samples)
+        )
+
+    # -- delete_last: walk to the predecessor vs one slot computation
+    count = 5_000
+    for name, factory in (
+        ("CircularLinkedList", CircularLinkedList),
+        ("RingBuffer", RingBuffer),
+    ):
+        ring = factory()
+        for value in range(count):
+            ring.append(value)
+        start = time.perf_counter()
+        while len(ring):
+            ring.delete_last()
+        elapsed = time.perf_counter() - start
+        print(f"{name:<19} {count} x delete_last: {elapsed * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,11 +4,19 @@ class Node:
         self.next = next
 
 
+def _identity(value):
+    return value
+
+
 class LinkedList:
-    def __init__(self):
+    def __init__(self, indexed=False):
         self.head = None
         self.tail = None
         self.size = 0
+        # indexed mode: value -> {node: None} (insertion-ordered set of nodes)
+        # and node -> predecessor, for O(1) contains / remove(value)
+        self._index = {} if indexed else None
+        self._prev = {} if indexed else None
 
     # -- helper: _node_at(index), _is_empty, _is_valid_index(index)
     def _is_valid_index(self, index) -> bool:
@@ -26,6 +34,48 @@ class LinkedList:
     def _is_empty(self):
         return self.size == 0
 
+    # -- helper: value index (indexed mode only)
+    def _index_node(self, node, prev_node):
+        """Record a node that has just been linked in after prev_node"""
+        if self._index is None:
+            return
+        self._index.setdefault(node.value, {})[node] = None
+        self._prev[node] = prev_node
+        if node.next is not None:
+            self._prev[node.next] = node
+
+    def _unindex_node(self, node):
+        """Forget a node that is about to be unlinked (node.next still set)"""
+        if self._index is None:
+            return
+        nodes = self._index[node.value]
+        del nodes[node]
+        if not nodes:
+            del self._index[node.value]
+        prev_node = self._prev.pop(node)
+        if node.next is not None:
+            self._prev[node.next] = prev_node
+
+    def _index_chain(self, first, prev_node, count):
+        if self._index is None:
+            return
+        for _ in range(count):
+            self._index_node(first, prev_node)
+            prev_node, first = first, first.next
+
+    def _reindex(self):
+        """Rebuild the index after a bulk relink - O(n)"""
+        if self._index is None:
+            return
+        self._index, self._prev = {}, {}
+        self._index_chain(self.head, None, self.size)
+
+    def _clear(self):
+        self.head = self.tail = None
+        self.size = 0
+        if self._index is not None:
+            self._index, self._prev = {}, {}
+
     # -- define CRUD operations: prepend, append, insert_at, delete_first, delete_last, delete_at, find
     def prepend(self, value):
         new_node = Node(value, self.head)
@@ -35,9 +85,11 @@ class LinkedList:
             self.tail = new_node
 
         self.size += 1
+        self._index_node(new_node, None)
 
     def append(self, value):
         new_node = Node(value, None)
+        prev_node = self.tail
         if self._is_empty():
             self.head = self.tail = new_node
         else:
@@ -45,6 +97,7 @@ class LinkedList:
             self.tail = new_node
 
         self.size += 1
+        self._index_node(new_node, prev_node)
 
     def insert_at(self, value, index):
         if index == 0:
@@ -60,11 +113,13 @@ class LinkedList:
             new_node = Node(value, current)
             prev_node.next = new_node
             self.size += 1
+            self._index_node(new_node, prev_node)
 
     def delete_first(self):
         if self._is_empty():
             return -1
 
+        self._unindex_node(self.head)
         if self.size == 1:
             self.head = None
             self.tail = None
@@ -77,12 +132,17 @@ class LinkedList:
         if self._is_empty():
             return -1
 
+        old_tail = self.tail
         if self.size == 1:
             self.head = None
             self.tail = None
+        elif self._prev is not None:  # indexed: the predecessor is known
+            self.tail = self._prev[old_tail]
+            self.tail.next = None
         else:
             self.tail = self._node_at(self.size - 2)
             self.tail.next = None
+        self._unindex_node(old_tail)
 
         self.size -= 1
 
@@ -96,10 +156,14 @@ class LinkedList:
         else:
             prev_node = self._node_at(index - 1)
             current_node = prev_node.next
+            self._unindex_node(current_node)
             prev_node.next = current_node.next
             self.size -= 1
 
     def find(self, value) -> int:
+        if (self._index is not None) and (value not in self._index):
+            return -1  # a miss costs O(1); a hit still walks to count the position
+
         index = -1
         current_node = self.head
         for idx in range(self.size):
@@ -109,6 +173,131 @@ class LinkedList:
             current_node = current_node.next
         return index
 
+    def contains(self, value) -> bool:
+        if self._index is not None:
+            return value in self._index
+        return self.find(value) != -1
+
+    def remove(self, value):
+        """Delete a node holding value: the first one, or any one if indexed"""
+        if self._index is not None:
+            if value not in self._index:
+                raise ValueError("Value not in linked list.")
+            current_node = next(iter(self._index[value]))
+            prev_node = self._prev[current_node]
+        else:
+            prev_node, current_node = None, self.head
+            while current_node and current_node.value != value:
+                prev_node, current_node = current_node, current_node.next
+            if current_node is None:
+                raise ValueError("Value not in linked list.")
+
+        self._unindex_node(current_node)
+        if prev_node is None:
+            self.head = current_node.next
+        else:
+            prev_node.next = current_node.next
+        if current_node is self.tail:
+            self.tail = prev_node
+        self.size -= 1
+
+    # -- bulk operations: from_iterable, extend, splice, slice, remove_if
+    @staticmethod
+    def _chain(iterable):
+        """Link the values into a fresh chain in one pass -> (first, last, count)"""
+        first = last = None
+        count = 0
+        for value in iterable:
+            new_node = Node(value, None)
+            if last is None:
+                first = new_node
+            else:
+                last.next = new_node
+            last = new_node
+            count += 1
+        return first, last, count
+
+    @classmethod
+    def from_iterable(cls, iterable, indexed=False):
+        linked_list = cls(indexed)
+        linked_list.extend(iterable)
+        return linked_list
+
+    def extend(self, iterable):
+        first, last, count = self._chain(iterable)
+        if count == 0:
+            return
+
+        prev_node = self.tail
+        if self._is_empty():
+            self.head = first
+        else:
+            self.tail.next = first
+        self.tail = last
+        self.size += count
+        self._index_chain(first, prev_node, count)
+
+    def splice(self, other, index):
+        """Move all nodes of other in before position index; other ends up empty"""
+        if other is self:
+            raise ValueError("Cannot splice a linked list into itself.")
+        assert 0 <= index <= self.size
+        if other._is_empty():
+            return
+
+        if index == 0:
+            prev_node = None
+            other.tail.next = self.head
+            self.head = other.head
+            if self._is_empty():
+                self.tail = other.tail
+        elif index == self.size:
+            prev_node = self.tail
+            self.tail.next = other.head
+            self.tail = other.tail
+        else:
+            prev_node = self._node_at(index - 1)
+            other.tail.next = prev_node.next
+            prev_node.next = other.head
+
+        self.size += other.size
+        self._index_chain(other.head, prev_node, other.size)
+        other._clear()
+
+    def slice(self, start, stop):
+        """New LinkedList with the values at positions start..stop-1 (slice rules)"""
+        start, stop, _ = slice(start, stop).indices(self.size)
+        current = self._node_at(start) if start < stop else None
+
+        def values():
+            node = current
+            for _ in range(start, stop):
+                yield node.value
+                node = node.next
+
+        return self.from_iterable(values(), self._index is not None)
+
+    def remove_if(self, predicate) -> int:
+        """Delete every node whose value satisfies predicate; returns how many"""
+        removed = 0
+        prev_node = None
+        current = self.head
+        while current:
+            if predicate(current.value):
+                if prev_node is None:
+                    self.head = current.next
+                else:
+                    prev_node.next = current.next
+                removed += 1
+            else:
+                prev_node = current
+            current = current.next
+
+        self.tail = prev_node
+        self.size -= removed
+        self._reindex()
+        return removed
+
     # -- reverse, merge sorted linked lists
     def reverse(self):
         if self._is_empty():
@@ -128,33 +317,88 @@ class LinkedList:
             self.head.next = None
             self.tail = self.head
             self.head = prev_node
+            self._reindex()
+
+    @staticmethod
+    def _cut(node, count):
+        """Detach the chain after the first count nodes starting at node; return the rest"""
+        for _ in range(count - 1):
+            if node is None:
+                return None
+            node = node.next
+        if node is None:
+            return None
+        rest = node.next
+        node.next = None
+        return rest
+
+    @staticmethod
+    def _merge_chains(first, second, key, reverse):
+        """Relink two sorted chains into one -> (head, tail); on ties first goes first"""
+        if first is None or second is None:
+            head = tail = first or second
+        else:
+            head = tail = None
+            while first and second:
+                first_key, second_key = key(first.value), key(second.value)
+                if (second_key > first_key) if reverse else (second_key < first_key):
+                    node, second = second, second.next
+                else:
+                    node, first = first, first.next
+                if tail is None:
+                    head = node
+                else:
+                    tail.next = node
+                tail = node
+            tail.next = first or second
+
+        while tail and tail.next:
+            tail = tail.next
+        return head, tail
+
+    def sort(self, key=None, reverse=False):
+        """Stable bottom-up merge sort that relinks the nodes: O(n log n), O(1) memory"""
+        if self.size < 2:
+            return None
+        if key is None:
+            key = _identity
+
+        width = 1
+        while width < self.size:
+            head = tail = None
+            current = self.head
+            while current:
+                first = current
+                second = self._cut(first, width)
+                current = self._cut(second, width)
+                merged_head, merged_tail = self._merge_chains(
+                    first, second, key, reverse
+                )
+                if tail is None:
+                    head = merged_head
+                else:
+                    tail.next = merged_head
+                tail = merged_tail
+            self.head, self.tail = head, tail
+            width *= 2
+        self._reindex()
+        return None
 
     @staticmethod
-    def merge_sorted(l1, l2):
+    def merge_sorted(l1, l2, key=None, reverse=False):
         """
-        Merge two sorted LinkedList instances and return a new sorted LinkedList.
-        You need to implement this logic!
+        Merge two sorted LinkedList instances into a new sorted LinkedList.
+        The nodes are relinked, not copied: l1 and l2 are left empty.
         """
-        # TODO: Implement merge logic here
-        merged = LinkedList()
-        node_1 = l1.head
-        node_2 = l2.head
-        for index in range(l1.size + l2.size):
-            if (not node_1) and (not node_2):
-                break
-            elif (not node_1) and (node_2):
-                merged.append(node_2.value)
-                node_2 = node_2.next
-            elif (node_1) and (not node_2):
-                merged.append(node_1.value)
-                node_1 = node_1.next
-            else:
-                if node_1.value <= node_2.value:
-                    merged.append(node_1.value)
-                    node_1 = node_1.next
-                else:
-                    merged.append(node_2.value)
-                    node_2 = node_2.next
+        merged = LinkedList(l1._index is not None)
+        merged.head, merged.tail = LinkedList._merge_chains(
+            l1.head, l2.head, key or _identity, reverse
+        )
+        merged.size = l1.size + l2.size
+        merged._reindex()
+
+        l1._clear()
+        l2._clear()
         return merged
 
     # -- syntactic sugar : __len__, __iter__, __str__
@@ -162,6 +406,9 @@ class LinkedList:
     def __len__(self) -> int:
         return self.size
 
+    def __contains__(self, value) -> bool:
+        return self.contains(value)
+
     def __iter__(self):
         current = self.head
         while current:
@@ -203,5 +450,29 @@ def main():
     merged = LinkedList.merge_sorted(ll1, ll2)
     print("Merged:", merged)
 
-
-main()
+    ll = LinkedList.from_iterable(range(10))
+    ll.remove_if(lambda value: value % 3 == 0)
+    print("Without multiples of 3:", ll)
+    ll.splice(LinkedList.from_iterable([100, 200]), 2)
+    print("After splicing [100, 200] at 2:", ll)
+    print("Slice [1:4]:", ll.slice(1, 4))
+
+    ll = LinkedList.from_iterable([5, 3, 9, 1, 7, 3])
+    ll.sort()
+    print("Sorted:", ll)
+    ll.sort(reverse=True)
+    print("Sorted descending:", ll)
+
+    # -- indexed mode: an ordered set of session IDs with O(1) membership / removal
+    sessions = LinkedList.from_iterable(
+        (f"session-{i}" for i in range(100_000)), indexed=True
+    )
+    sessions.remove("session-99999")
+    sessions.remove("session-50000")
+    print(
+        "session-50000 active:", "session-50000" in sessions, "| size:", len(sessions)
+    )
+
+
+if __name__ == "__main__":
+    main()
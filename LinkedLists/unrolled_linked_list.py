@@ -0,0 +1,238 @@
+BLOCK_CAPACITY = 64  # values per block
+
+
+class Block:
+    """A node holding up to BLOCK_CAPACITY consecutive values in one Python list"""
+
+    def __init__(self, values=None, prev=None, next=None):
+        self.values = values if values is not None else []
+        self.prev = prev
+        self.next = next
+
+
+class UnrolledLinkedList:
+    """Linked list of blocks: the LinkedList API with 1/BLOCK_CAPACITY as many nodes.
+
+    Each Block keeps its values contiguous, so iteration, find and most of the
+    walk in _node_at run over list slots (in C) instead of chasing one pointer
+    per element. A full block splits in half on insert; a block that drops
+    below half full after a delete absorbs its successor when both fit in one.
+    """
+
+    def __init__(self, capacity: int = BLOCK_CAPACITY):
+        if capacity < 2:
+            raise ValueError("Block capacity must be at least 2.")
+        self.capacity = capacity
+        self.head = None  # first block
+        self.tail = None  # last block
+        self.size = 0
+        self.blocks = 0
+
+    # -- helper: _node_at(index), _is_empty, _is_valid_index(index), block management
+    def _is_valid_index(self, index) -> bool:
+        return 0 <= index < self.size
+
+    def _is_empty(self):
+        return self.size == 0
+
+    def _node_at(self, index):
+        """Return (block, offset) of position index, walking from the nearer end"""
+        assert self._is_valid_index(index)
+
+        if index < self.size // 2:
+            block = self.head
+            while index >= len(block.values):
+                index -= len(block.values)
+                block = block.next
+            return block, index
+
+        index = self.size - 1 - index  # position counted from the back
+        block = self.tail
+        while index >= len(block.values):
+            index -= len(block.values)
+            block = block.prev
+        return block, len(block.values) - 1 - index
+
+    def _link_after(self, block, new_block) -> None:
+        """Insert new_block after block (or as the only block if block is None)"""
+        new_block.prev = block
+        if block is None:
+            new_block.next = None
+            self.head = self.tail = new_block
+        else:
+            new_block.next = block.next
+            if block.next is None:
+                self.tail = new_block
+            else:
+                block.next.prev = new_block
+            block.next = new_block
+        self.blocks += 1
+
+    def _unlink(self, block) -> None:
+        if block.prev is None:
+            self.head = block.next
+        else:
+            block.prev.next = block.next
+        if block.next is None:
+            self.tail = block.prev
+        else:
+            block.next.prev = block.prev
+        self.blocks -= 1
+
+    def _split(self, block) -> None:
+        """Move the second half of a full block into a new block after it"""
+        half = len(block.values) // 2
+        self._link_after(block, Block(block.values[half:]))
+        del block.values[half:]
+
+    def _rebalance(self, block) -> None:
+        """After a delete: drop an empty block, merge a sparse one with its successor"""
+        if not block.values:
+            self._unlink(block)
+        elif (
+            len(block.values) < self.capacity // 2
+            and block.next is not None
+            and len(block.values) + len(block.next.values) <= self.capacity
+        ):
+            block.values.extend(block.next.values)
+            self._unlink(block.next)
+
+    # -- define CRUD operations: prepend, append, insert_at, delete_first, delete_last, delete_at, find
+    def prepend(self, value):
+        if self._is_empty() or len(self.head.values) >= self.capacity:
+            new_block = Block([value], None, self.head)
+            if self.head is None:
+                self.tail = new_block
+            else:
+                self.head.prev = new_block
+            self.head = new_block
+            self.blocks += 1
+        else:
+            self.head.values.insert(0, value)
+
+        self.size += 1
+
+    def append(self, value):
+        if self._is_empty() or len(self.tail.values) >= self.capacity:
+            self._link_after(self.tail, Block([value]))
+        else:
+            self.tail.values.append(value)
+
+        self.size += 1
+
+    def insert_at(self, value, index):
+        if index == 0:
+            self.prepend(value)
+        elif index == self.size:
+            self.append(value)
+        else:
+            assert self._is_valid_index(index)
+
+            block, offset = self._node_at(index)
+            if len(block.values) >= self.capacity:
+                self._split(block)
+                if offset > len(block.values):
+                    offset -= len(block.values)
+                    block = block.next
+            block.values.insert(offset, value)
+            self.size += 1
+
+    def delete_first(self):
+        if self._is_empty():
+            return -1
+
+        del self.head.values[0]
+        self.size -= 1
+        self._rebalance(self.head)
+
+    def delete_last(self):
+        if self._is_empty():
+            return -1
+
+        self.tail.values.pop()
+        self.size -= 1
+        if not self.tail.values:
+            self._unlink(self.tail)
+
+    def delete_at(self, index):
+        assert self._is_valid_index(index)
+
+        block, offset = self._node_at(index)
+        del block.values[offset]
+        self.size -= 1
+        self._rebalance(block)
+
+    def find(self, value) -> int:
+        index = 0
+        block = self.head
+        while block:
+            try:
+                return index + block.values.index(value)
+            except ValueError:
+                index += len(block.values)
+                block = block.next
+        return -1
+
+    # -- reverse
+    def reverse(self):
+        if self._is_empty():
+            raise ValueError("Cannot reverse an empty linked list.")
+
+        block = self.head
+        while block:
+            block.values.reverse()
+            block.prev, block.next = block.next, block.prev
+            block = block.prev  # the old next
+        self.head, self.tail = self.tail, self.head
+
+    # -- syntactic sugar : __len__, __iter__, __str__
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self):
+        block = self.head
+        while block:
+            yield from block.values
+            block = block.next
+
+    def __str__(self) -> str:
+        return " --> ".join(str(value) for value in self)
+
+
+def main():
+    import random
+    import time
+
+    from singly_linked_lists import LinkedList
+
+    ull = UnrolledLinkedList(capacity=4)
+    for value in range(10):
+        ull.append(value)
+    ull.insert_at(100, 5)
+    ull.delete_at(2)
+    ull.prepend(-1)
+    print(ull, "| blocks:", ull.blocks)
+    ull.reverse()
+    print(ull)
+
+    # -- node count and search speed vs one Node per element
+    size = 200_000
+    targets = [random.randrange(size) for _ in range(20)]
+    for name, linked_list in (
+        ("LinkedList", LinkedList()),
+        ("UnrolledLinkedList", UnrolledLinkedList()),
+    ):
+        for value in range(size):
+            linked_list.append(value)
+        nodes = getattr(linked_list, "blocks", size)
+
+        start = time.perf_counter()
+        for target in targets:
+            linked_list.find(target)
+        elapsed = time.perf_counter() - start
+        print(f"{name:<20} nodes: {nodes:>7}, 20 finds: {elapsed * 1000:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+import asyncio
+import sys
+from collections import deque
+
+from queues import ArrayQueue
+
+
+class QueueClosed(Exception):
+    """put on a closed AsyncQueue, or get once it is closed and drained"""
+
+
+class AsyncQueue:
+    """asyncio FIFO queue on an ArrayQueue, with batched awaits.
+
+    Waiting coroutines park on futures: one per coroutine, woken one at a
+    time. A coroutine woken by a batch takes up to n items in one go and, if
+    it leaves items (or free slots) behind, wakes the next waiter - so one
+    event-loop turn moves a whole batch instead of one task wake-up per item.
+
+    maxsize bounds the queue (0 = unbounded): put / put_many then wait for
+    room, which is the backpressure on producers. close() stops further puts;
+    consumers still get the remaining items, then QueueClosed.
+    """
+
+    def __init__(self, maxsize: int = 0):
+        self.maxsize = maxsize
+        self.closed = False
+        self._queue = ArrayQueue()
+        self._getters = deque()  # futures of coroutines waiting for items
+        self._putters = deque()  # ... for free slots
+        self._drainers = deque()  # ... for the queue to become empty
+
+    # -- helpers
+
+    def _room(self) -> int:
+        if self.maxsize <= 0:
+            return sys.maxsize  # unbounded: always room
+        return self.maxsize - len(self._queue)
+
+    @staticmethod
+    def _wake(waiters: deque) -> None:
+        """Wake the first waiter that is still waiting"""
+        while waiters:
+            future = waiters.popleft()
+            if not future.done():
+                future.set_result(None)
+                return None
+        return None
+
+    @staticmethod
+    def _wake_all(waiters: deque) -> None:
+        while waiters:
+            future = waiters.popleft()
+            if not future.done():
+                future.set_result(None)
+        return None
+
+    async def _wait(self, waiters: deque, deadline: float = None) -> bool:
+        """Park until woken (True) or until the loop time reaches deadline (False)"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        waiters.append(future)
+        timeout = None if deadline is None else max(0.0, deadline - loop.time())
+        try:
+            await asyncio.wait_for(future, timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        except BaseException:
+            self._wake(waiters)  # a wake-up may have raced the cancellation
+            raise
+        finally:
+            if future in waiters:
+                waiters.remove(future)
+
+    def _after_put(self) -> None:
+        self._wake(self._getters)
+        if self._room() > 0:
+            self._wake(self._putters)
+        return None
+
+    def _after_get(self) -> None:
+        self._wake(self._putters)
+        if len(self._queue):
+            self._wake(self._getters)
+        else:
+            self._wake_all(self._drainers)
+        return None
+
+    def _check_open(self) -> None:
+        if self.closed:
+            raise QueueClosed("Cannot put into a closed queue.")
+        return None
+
+    # -- put_nowait, put_nowait_many, put, put_many
+
+    def put_nowait(self, item) -> None:
+        self._check_open()
+        if self._room() <= 0:
+            raise asyncio.QueueFull
+        self._queue.enqueue(item)
+        self._after_put()
+
+    def put_nowait_many(self, items) -> int:
+        """Add as many items as fit right now; returns how many were added"""
+        self._check_open()
+        items = items if isinstance(items, (list, tuple)) else list(items)
+        count = min(len(items), self._room())
+        if count > 0:
+            self._queue.enqueue_many(items[:count])
+            self._after_put()
+        return count
+
+    async def put(self, item) -> None:
+        while self._room() <= 0:
+            self._check_open()
+            await self._wait(self._putters)
+        self.put_nowait(item)
+
+    async def put_many(self, items) -> None:
+        """Add all items, waiting for room (backpressure) whenever the queue is full"""
+        items = items if isinstance(items, (list, tuple)) else list(items)
+        added = self.put_nowait_many(items)
+        while added < len(items):
+            self._check_open()
+            await self._wait(self._putters)
+            added += self.put_nowait_many(items[added:])
+
+    # -- get_nowait, get, get_batch
+
+    def get_nowait(self):
+        if not len(self._queue):
+            if self.closed:
+                raise QueueClosed("Queue is closed and drained.")
+            raise asyncio.QueueEmpty
+        item = self._queue.dequeue()
+        self._after_get()
+        return item
+
+    async def get(self):
+        return (await self.get_batch(1))[0]
+
+    async def get_batch(self, max_items: int, timeout: float = None) -> list:
+        """Wait up to timeout for at least one item, then take up to max_items at
+        once; returns [] on timeout, raises QueueClosed once closed and drained"""
+        if max_items < 1:
+            raise ValueError("max_items must be at least 1.")
+        deadline = None
+        if timeout is not None:
+            deadline = asyncio.get_running_loop().time() + timeout
+
+        while not len(self._queue):
+            if self.closed:
+                raise QueueClosed("Queue is closed and drained.")
+            if not await self._wait(self._getters, deadline):
+                return []
+        items = self._queue.dequeue_many(max_items)
+        self._after_get()
+        return items
+
+    # -- close and drain
+
+    def close(self) -> None:
+        """No more puts; waiting producers get QueueClosed, consumers drain what is left"""
+        self.closed = True
+        self._wake_all(self._getters)
+        self._wake_all(self._putters)
+
+    async def drain(self) -> None:
+        """Wait until every item has been taken"""
+        while len(self._queue):
+            await self._wait(self._drainers)
+
+    # -- Pythonic Functionality
+
+    def __len__(self):
+        return len(self._queue)
+
+    def empty(self) -> bool:
+        return len(self._queue) == 0
+
+    def full(self) -> bool:
+        return self._room() <= 0
+
+
+# -----------------------------------------
+def main():
+    import time
+
+    messages, batch = 200_000, 500
+
+    async def demo():
+        queue = AsyncQueue(maxsize=4)
+        print("put_nowait_many(range(6)) added:", queue.put_nowait_many(range(6)))
+        print("get_batch(3):", await queue.get_batch(3))
+        queue.close()
+        print("After close, drained:", await queue.get_batch(10))
+        try:
+            await queue.get_batch(10)
+        except QueueClosed as error:
+            print("Then:", error)
+        print("get_batch on an empty queue:", await AsyncQueue().get_batch(5, 0.01))
+
+    async def asyncio_queue():
+        queue = asyncio.Queue(maxsize=4096)
+
+        async def produce():
+            for message in range(messages):
+                await queue.put(message)
+
+        async def consume():
+            for _ in range(messages):
+                await queue.get()
+
+        await asyncio.gather(produce(), consume())
+
+    async def batched_queue():
+        queue = AsyncQueue(maxsize=4096)
+
+        async def produce():
+            for offset in range(0, messages, batch):
+                await queue.put_many(range(offset, offset + batch))
+            queue.close()
+
+        async def consume():
+            while True:
+                try:
+                    await queue.get_batch(batch)
+                except QueueClosed:
+                    return
+
+        await asyncio.gather(produce(), consume())
+
+    asyncio.run(demo())
+    for name, benchmark in (
+        ("asyncio.Queue (per item)", asyncio_queue),
+        ("AsyncQueue (batches)", batched_queue),
+    ):
+        start = time.perf_counter()
+        asyncio.run(benchmark())
+        elapsed = time.perf_counter() - start
+        print(f"{name:<25} {messages / elapsed:>12,.0f} messages/s")
+
+
+# -----------------------------------------
+
+if __name__ == "__main__":
+    main()
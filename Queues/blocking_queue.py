@@ -0,0 +1,223 @@
+import threading
+import time
+from queue import Empty, Full
+
+from queues import ArrayQueue
+
+
+class BlockingQueue:
+    """Bounded, thread-safe FIFO queue on an ArrayQueue, with batch put / get.
+
+    One lock guards the buffer; producers wait on not_full and consumers on
+    not_empty. put_batch / get_batch move a whole batch under one acquisition
+    and wake one waiter per batch - a woken thread that leaves work (items or
+    free slots) behind passes the wake-up on, so idle threads are not all
+    stirred for every message.
+
+    Backpressure: on_high(size) runs when the size reaches high_watermark, and
+    on_low(size) when it then drains down to low_watermark. Both run after the
+    lock is released, in the thread that crossed the mark.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        high_watermark: int = None,
+        low_watermark: int = None,
+        on_high=None,
+        on_low=None,
+    ):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1.")
+        self.maxsize = maxsize
+        self.high_watermark = maxsize if high_watermark is None else high_watermark
+        self.low_watermark = maxsize // 2 if low_watermark is None else low_watermark
+        if not 0 <= self.low_watermark < self.high_watermark <= maxsize:
+            raise ValueError("Need 0 <= low_watermark < high_watermark <= maxsize.")
+        self.on_high = on_high
+        self.on_low = on_low
+
+        self._queue = ArrayQueue()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._above_high = False  # between crossing high and coming back to low
+
+    # -- helpers (call with the lock held)
+
+    def _has_items(self) -> bool:
+        return self._queue.size > 0
+
+    def _has_room(self) -> bool:
+        return self._queue.size < self.maxsize
+
+    @staticmethod
+    def _wait(condition, predicate, block: bool, deadline: float) -> bool:
+        if predicate():
+            return True
+        if not block:
+            return False
+        timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+        return condition.wait_for(predicate, timeout)
+
+    @staticmethod
+    def _deadline(timeout: float) -> float:
+        if (timeout is not None) and (timeout < 0):
+            raise ValueError("timeout must be a non-negative number.")
+        return None if timeout is None else time.monotonic() + timeout
+
+    def _after_put(self):
+        """Pass on wake-ups; returns the watermark callback to run, if any"""
+        self._not_empty.notify()
+        if self._has_room():
+            self._not_full.notify()
+        if (not self._above_high) and (self._queue.size >= self.high_watermark):
+            self._above_high = True
+            return self.on_high
+        return None
+
+    def _after_get(self):
+        self._not_full.notify()
+        if self._has_items():
+            self._not_empty.notify()
+        if self._above_high and (self._queue.size <= self.low_watermark):
+            self._above_high = False
+            return self.on_low
+        return None
+
+    @staticmethod
+    def _run(callback, size: int) -> None:
+        if callback is not None:
+            callback(size)
+        return None
+
+    # -- put, put_batch, get, get_batch
+
+    def put(self, item, block: bool = True, timeout: float = None) -> None:
+        """Add an item, waiting up to timeout for a free slot (raises queue.Full)"""
+        deadline = self._deadline(timeout)
+        with self._lock:
+            if not self._wait(self._not_full, self._has_room, block, deadline):
+                raise Full
+            self._queue.enqueue(item)
+            callback, size = self._after_put(), self._queue.size
+        self._run(callback, size)
+
+    def put_batch(self, items, timeout: float = None) -> int:
+        """Add all items, as many per lock acquisition as fit; returns how many
+        were added (fewer than len(items) only if the timeout ran out)"""
+        items = items if isinstance(items, (list, tuple)) else list(items)
+        deadline = self._deadline(timeout)
+        added = 0
+        while added < len(items):
+            with self._lock:
+                if not self._wait(self._not_full, self._has_room, True, deadline):
+                    break
+                chunk = items[added : added + self.maxsize - self._queue.size]
+                self._queue.enqueue_many(chunk)
+                added += len(chunk)
+                callback, size = self._after_put(), self._queue.size
+            self._run(callback, size)
+        return added
+
+    def get(self, block: bool = True, timeout: float = None):
+        """Remove the front item, waiting up to timeout for one (raises queue.Empty)"""
+        deadline = self._deadline(timeout)
+        with self._lock:
+            if not self._wait(self._not_empty, self._has_items, block, deadline):
+                raise Empty
+            item = self._queue.dequeue()
+            callback, size = self._after_get(), self._queue.size
+        self._run(callback, size)
+        return item
+
+    def get_batch(self, max_items: int, timeout: float = None) -> list:
+        """Wait up to timeout for at least one item, then take up to max_items
+        under the same lock; returns [] if the timeout ran out"""
+        if max_items < 1:
+            raise ValueError("max_items must be at least 1.")
+        deadline = self._deadline(timeout)
+        with self._lock:
+            if not self._wait(self._not_empty, self._has_items, True, deadline):
+                return []
+            items = self._queue.dequeue_many(max_items)
+            callback, size = self._after_get(), self._queue.size
+        self._run(callback, size)
+        return items
+
+    # -- Pythonic Functionality
+
+    def __len__(self):
+        with self._lock:
+            return self._queue.size
+
+    def empty(self) -> bool:
+        return len(self) == 0
+
+    def full(self) -> bool:
+        return len(self) >= self.maxsize
+
+
+# -----------------------------------------
+def main():
+    import queue
+
+    events = []
+    bq = BlockingQueue(
+        maxsize=8,
+        high_watermark=6,
+        low_watermark=2,
+        on_high=lambda size: events.append(f"high ({size})"),
+        on_low=lambda size: events.append(f"low ({size})"),
+    )
+    print("put_batch(range(10), timeout=0.1) added:", bq.put_batch(range(10), 0.1))
+    print("get_batch(5):", bq.get_batch(5), "| get:", bq.get(), "| get:", bq.get())
+    print("Watermark events:", events)
+    try:
+        BlockingQueue(maxsize=1).get(timeout=0.01)
+    except Empty:
+        print("get on an empty queue timed out")
+
+    # -- 4 producers, 1 consumer: one lock round trip per message vs per batch
+    producers, per_producer, batch = 4, 50_000, 256
+    total = producers * per_producer
+    messages = list(range(per_producer))
+
+    def run(produce, take):
+        def consume():
+            received = 0
+            while received < total:
+                received += take()
+
+        threads = [threading.Thread(target=produce) for _ in range(producers)]
+        threads.append(threading.Thread(target=consume))
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return time.perf_counter() - start
+
+    stdlib = queue.Queue(maxsize=4096)
+
+    def produce_items():
+        for message in messages:
+            stdlib.put(message)
+
+    elapsed = run(produce_items, lambda: len([stdlib.get()]))
+    print(f"queue.Queue (per item)   {total / elapsed:>12,.0f} messages/s")
+
+    blocking = BlockingQueue(maxsize=4096)
+
+    def produce_batches():
+        for offset in range(0, per_producer, batch):
+            blocking.put_batch(messages[offset : offset + batch])
+
+    elapsed = run(produce_batches, lambda: len(blocking.get_batch(batch)))
+    print(f"BlockingQueue (batches)  {total / elapsed:>12,.0f} messages/s")
+
+
+# -----------------------------------------
+
+if __name__ == "__main__":
+    main()
@@ -64,6 +64,136 @@ class Queue:
         return " -- ".join(result)
 
 
+class ArrayQueue:
+    """Queue on a growable circular buffer, with batch enqueue / dequeue.
+
+    The values sit in slots head, head + 1, ... of one list, wrapping around
+    (the capacity is a power of two, so wrapping is a bit mask). No Node is
+    allocated per value, and enqueue_many / dequeue_many move a whole batch
+    with at most two slice copies. The buffer doubles when full and halves
+    when a quarter full, down to MIN_CAPACITY.
+    """
+
+    MIN_CAPACITY = 16
+
+    def __init__(self, capacity: int = MIN_CAPACITY):
+        self.items = [None] * self._round_up(capacity)
+        self.mask = len(self.items) - 1  # slot = position & mask
+        self.head = 0  # slot of the front value
+        self.size = 0
+
+    # -- Helper Functions
+
+    def is_empty(self) -> bool:
+        return self.size == 0
+
+    @classmethod
+    def _round_up(cls, capacity: int) -> int:
+        """Smallest power of two >= capacity (and >= MIN_CAPACITY)"""
+        return max(cls.MIN_CAPACITY, 1 << (capacity - 1).bit_length())
+
+    @property
+    def capacity(self) -> int:
+        return len(self.items)
+
+    def _resize(self, capacity: int) -> None:
+        items = [None] * capacity
+        items[: self.size] = self._read(self.size)
+        self.items = items
+        self.mask = capacity - 1
+        self.head = 0
+        return None
+
+    def _read(self, count: int) -> list:
+        """The first count values, front first (at most two slice copies)"""
+        end = self.head + count
+        if end <= self.capacity:
+            return self.items[self.head : end]
+        return self.items[self.head :] + self.items[: end - self.capacity]
+
+    def _clear_slots(self, count: int) -> None:
+        """Drop the references held by the first count slots from head"""
+        end = self.head + count
+        if end <= self.capacity:
+            self.items[self.head : end] = [None] * count
+        else:
+            self.items[self.head :] = [None] * (self.capacity - self.head)
+            self.items[: end - self.capacity] = [None] * (end - self.capacity)
+        return None
+
+    def _shrink(self) -> None:
+        """Halve (or more) a buffer that is at most a quarter full"""
+        self._resize(self._round_up(2 * self.size))
+        return None
+
+    # -- CRUD Operations: enqueue(value), dequeue(), peek, enqueue_many, dequeue_many
+
+    def peek(self):
+        if self.is_empty():
+            return None
+        return self.items[self.head]
+
+    def enqueue(self, value) -> None:
+        if self.size == len(self.items):
+            self._resize(2 * len(self.items))
+        self.items[(self.head + self.size) & self.mask] = value
+        self.size += 1
+        return None
+
+    def dequeue(self):
+        if self.is_empty():
+            return None
+        items, head = self.items, self.head
+        value = items[head]
+        items[head] = None
+        self.head = (head + 1) & self.mask
+        self.size -= 1
+        if (self.size <= len(items) >> 2) and (len(items) > self.MIN_CAPACITY):
+            self._shrink()
+        return value
+
+    def enqueue_many(self, values) -> None:
+        """Enqueue every value of an iterable, front first"""
+        if not isinstance(values, (list, tuple)):
+            values = list(values)
+        count = len(values)
+        if self.size + count > self.capacity:
+            self._resize(self._round_up(self.size + count))
+
+        tail = (self.head + self.size) & self.mask
+        first = min(count, self.capacity - tail)  # slots before the wrap
+        self.items[tail : tail + first] = values[:first]
+        if first < count:
+            self.items[: count - first] = values[first:]
+        self.size += count
+        return None
+
+    def dequeue_many(self, count: int) -> list:
+        """Dequeue up to count values; returns them as a list, front first"""
+        if count < 0:
+            raise ValueError("count must be non-negative.")
+        count = min(count, self.size)
+        if count == 0:
+            return []
+        values = self._read(count)
+        self._clear_slots(count)
+        self.head = (self.head + count) & self.mask
+        self.size -= count
+        if (self.size <= self.capacity >> 2) and (self.capacity > self.MIN_CAPACITY):
+            self._shrink()
+        return values
+
+    # -- Pythonic Functionality
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        yield from self._read(self.size)
+
+    def __str__(self):
+        return " -- ".join(str(value) for value in self)
+
+
 # -----------------------------------------
 def main():
     q = Queue()
@@ -85,8 +215,35 @@ def main():
     print("Peek on empty queue:", q.peek())
     print("Dequeue on empty queue:", q.dequeue())
 
+    aq = ArrayQueue()
+    aq.enqueue_many(range(10))
+    aq.enqueue(10)
+    print("ArrayQueue after enqueue_many(range(10)) and enqueue(10):", aq)
+    print("dequeue_many(4):", aq.dequeue_many(4), "| peek:", aq.peek())
+
+    # -- throughput: one call per message vs batches of 1,000
+    import time
+
+    messages, batch = 1_000_000, 1_000
+    for name, queue, batched in (
+        ("Queue", Queue(), False),
+        ("ArrayQueue", ArrayQueue(), False),
+        ("ArrayQueue (batches)", ArrayQueue(), True),
+    ):
+        start = time.perf_counter()
+        if batched:
+            for offset in range(0, messages, batch):
+                queue.enqueue_many(range(offset, offset + batch))
+                queue.dequeue_many(batch)
+        else:
+            for message in range(messages):
+                queue.enqueue(message)
+                queue.dequeue()
+        elapsed = time.perf_counter() - start
+        print(f"{name:<21} {messages / elapsed:>13,.0f} messages/s")
 
-# -----------------------------------------
 
+# -----------------------------------------
 
-main()
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+from sorting import Sorter
+
+try:
+    import numpy as np
+except ImportError:  # BatchSorter falls back to one Sorter per row
+    np = None
+
+# Widest rows a sorting network beats np.sort(axis=1) on (measured with NumPy 2.x,
+# whose row sort is SIMD); halved for 8-byte items, which double the memory traffic
+NETWORK_MAX_WIDTH = 8
+
+
+def batcher_network(width: int) -> list:
+    """Comparators (i, j), i < j, of Batcher's odd-even merge sort for width inputs
+
+    Built for the next power of two and pruned to width (the missing inputs act
+    as +infinity and never move, so their comparators can be dropped).
+    """
+    comparators = []
+    merge_size = 1
+    while merge_size < width:
+        gap = merge_size
+        while gap >= 1:
+            for start in range(gap % merge_size, width - gap, 2 * gap):
+                for offset in range(min(gap, width - start - gap)):
+                    first = start + offset
+                    second = first + gap
+                    # only compare elements of the same merge block
+                    if first // (2 * merge_size) == second // (2 * merge_size):
+                        comparators.append((first, second))
+            gap //= 2
+        merge_size *= 2
+    return comparators
+
+
+class BatchSorter:
+    """Sort every row of a 2-D batch (many small, equal-length arrays) at once.
+
+    The batch is transposed so each position is one contiguous column; for
+    narrow rows (see NETWORK_MAX_WIDTH) a sorting network then runs with every
+    compare-exchange applied to all rows by one np.minimum / np.maximum pair.
+    Wider rows, non-numeric dtypes and float batches holding NaN use
+    np.sort(axis=1). The per-row cost is a few vector lanes, not a Python call.
+    """
+
+    def __init__(self):
+        self._networks = {}  # width -> comparator list, built on first use
+
+    def _network(self, width: int) -> list:
+        if width not in self._networks:
+            self._networks[width] = batcher_network(width)
+        return self._networks[width]
+
+    def _sort_columns(self, columns) -> None:
+        """Run the sorting network over a (width, rows) array in place"""
+        scratch = np.empty_like(columns[0])
+        for first, second in self._network(len(columns)):
+            np.minimum(columns[first], columns[second], out=scratch)
+            np.maximum(columns[first], columns[second], out=columns[second])
+            columns[first] = scratch
+        return None
+
+    def sort(self, rows, reverse=False):
+        """Return a sorted copy of rows (2-D ndarray or list of equal-length rows)"""
+        if np is None:
+            if len({len(row) for row in rows}) > 1:
+                raise ValueError("All rows must have the same length.")
+            result = []
+            for row in rows:
+                row = list(row)
+                Sorter(row).insertion_sort(reverse=reverse)
+                result.append(row)
+            return result
+
+        batch = np.asarray(rows)
+        if batch.ndim != 2:
+            raise ValueError("Expected a 2-D batch of equal-length rows.")
+
+        width = batch.shape[1]
+        max_width = NETWORK_MAX_WIDTH if batch.itemsize <= 4 else NETWORK_MAX_WIDTH // 2
+        # the network needs np.minimum / np.maximum loops (none for str, bytes,
+        # object) and NaN-free floats (they spread NaN through a row)
+        networkable = (batch.dtype.kind in "biuf") and not (
+            (batch.dtype.kind == "f") and np.isnan(batch).any()
+        )
+        if width < 2:
+            result = batch.copy()
+        elif (width > max_width) or not networkable:
+            result = np.sort(batch, axis=1)
+        else:
+            columns = np.array(batch.T, order="C", copy=True)  # never a view of rows
+            self._sort_columns(columns)
+            result = columns.T
+
+        if reverse:
+            result = result[:, ::-1]
+        result = np.ascontiguousarray(result)
+        return result.tolist() if isinstance(rows, list) else result
+
+
+def main():
+    import random
+    import time
+
+    sorter = BatchSorter()
+    print(f"Width 8 network: {len(batcher_network(8))} comparators")
+    print(f"Sorted rows: {sorter.sort([[3, 1, 2, 0], [9, 7, 8, 6]])}")
+
+    if np is None:
+        return None
+
+    for width in (4, 8, 64):
+        batch = np.random.randint(0, 1000, size=(200_000, width))
+
+        start = time.perf_counter()
+        result = sorter.sort(batch)
+        elapsed = time.perf_counter() - start
+        print(f"width {width:>2}: {len(batch) / elapsed:,.0f} rows/s (batched)")
+
+        sample = [random.sample(range(1000), width) for _ in range(2_000)]
+        start = time.perf_counter()
+        for row in sample:
+            Sorter(row).insertion_sort()
+        elapsed = time.perf_counter() - start
+        print(
+            f"width {width:>2}: {len(sample) / elapsed:,.0f} rows/s (one Sorter per row)"
+        )
+
+        assert (result == np.sort(batch, axis=1)).all()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+import heapq
+import mmap
+import os
+import struct
+import tempfile
+from itertools import starmap
+
+from sorting import Sorter
+
+# Rough in-memory cost of one unpacked record on top of its packed width
+# (tuple/int/bytes object headers + list slot + merge buffer slot)
+PYTHON_RECORD_OVERHEAD = 120
+
+
+class ExternalSorter:
+    """Sort files of fixed-width binary records that do not fit in memory.
+
+    1. Read memory-sized chunks, sort each with Sorter.merge_sort and spill it
+       to a temp file as packed binary (a sorted "run").
+    2. k-way merge up to `fan_in` runs at a time with a heap, reading every run
+       through a buffered (or memory-mapped) reader, until one run is left.
+
+    Records are compared field by field, so put the sort key first in `record_format`.
+    """
+
+    def __init__(
+        self,
+        record_format: str = "<q",
+        memory_limit: int = 64 * 1024 * 1024,
+        fan_in: int = None,
+        io_buffer_size: int = 1024 * 1024,
+        temp_dir: str = None,
+        use_mmap: bool = False,
+    ):
+        self.record = struct.Struct(record_format)
+        self.record_size = self.record.size
+        self.single_field = len(self.record.unpack(bytes(self.record_size))) == 1
+
+        self.memory_limit = memory_limit
+        self.io_buffer_size = max(io_buffer_size, self.record_size)
+        # default fan-in: as many input buffers as fit in the memory limit
+        self.fan_in = fan_in or max(2, memory_limit // self.io_buffer_size)
+        if self.fan_in < 2:
+            raise ValueError("fan_in must be at least 2.")
+        self.temp_dir = temp_dir
+        self.use_mmap = use_mmap
+
+        self.chunk_records = max(
+            1, memory_limit // (self.record_size + PYTHON_RECORD_OVERHEAD)
+        )
+        self.merge_passes = 0  # filled in by sort(), useful for tuning fan_in
+
+    # -- helpers: packing, reading and writing runs
+
+    def _unpack(self, data) -> list:
+        records = self.record.iter_unpack(data)
+        if self.single_field:
+            return [record[0] for record in records]
+        return list(records)
+
+    def _pack(self, records) -> bytes:
+        if self.single_field:
+            return b"".join(map(self.record.pack, records))
+        return b"".join(starmap(self.record.pack, records))
+
+    def _new_run_path(self) -> str:
+        handle, path = tempfile.mkstemp(suffix=".run", dir=self.temp_dir)
+        os.close(handle)
+        return path
+
+    def _read_run(self, path: str, buffer_size: int):
+        """Yield the records of a run file, one buffer of records at a time"""
+        block_bytes = max(1, buffer_size // self.record_size) * self.record_size
+        with open(path, "rb") as file:
+            if self.use_mmap and os.path.getsize(path) > 0:
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    view = memoryview(mapped)
+                    try:
+                        for start in range(0, len(view), block_bytes):
+                            yield from self._unpack(view[start : start + block_bytes])
+                    finally:
+                        view.release()
+            else:
+                while True:
+                    block = file.read(block_bytes)
+                    if not block:
+                        break
+                    yield from self._unpack(block)
+
+    def _write_records(self, records, path: str) -> None:
+        """Write an iterable of records, packing one output buffer at a time"""
+        block_records = max(1, self.io_buffer_size // self.record_size)
+        with open(path, "wb", buffering=self.io_buffer_size) as file:
+            block = []
+            for record in records:
+                block.append(record)
+                if len(block) == block_records:
+                    file.write(self._pack(block))
+                    block = []
+            if block:
+                file.write(self._pack(block))
+        return None
+
+    # -- stage 1: sorted runs
+
+    def _create_runs(self, input_path: str) -> list:
+        runs = []
+        chunk_bytes = self.chunk_records * self.record_size
+        with open(input_path, "rb") as file:
+            while True:
+                data = file.read(chunk_bytes)
+                if not data:
+                    break
+                if len(data) % self.record_size:
+                    raise ValueError("Input size is not a multiple of the record size.")
+
+                chunk = self._unpack(data)
+                del data
+                Sorter(chunk).merge_sort()
+
+                path = self._new_run_path()
+                with open(path, "wb") as run_file:
+                    run_file.write(self._pack(chunk))
+                runs.append(path)
+        return runs
+
+    # -- stage 2: k-way merge
+
+    def _merge(self, run_paths: list, output_path: str) -> None:
+        """Heap-based k-way merge of sorted run files into output_path"""
+        # keep total read-buffer memory within the limit, whatever the fan-in
+        buffer_size = max(self.record_size, self.memory_limit // (2 * len(run_paths)))
+        readers = [self._read_run(path, buffer_size) for path in run_paths]
+
+        def merged():
+            heap = []
+            for run_index, reader in enumerate(readers):
+                record = next(reader, None)
+                if record is not None:
+                    # run_index breaks ties, so equal records keep run order (stable)
+                    heap.append((record, run_index))
+            heapq.heapify(heap)
+
+            while heap:
+                record, run_index = heap[0]
+                yield record
+                following = next(readers[run_index], None)
+                if following is None:
+                    heapq.heappop(heap)
+                else:
+                    heapq.heapreplace(heap, (following, run_index))
+
+        try:
+            self._write_records(merged(), output_path)
+        finally:
+            for reader in readers:
+                reader.close()
+        return None
+
+    def sort(self, input_path: str, output_path: str) -> None:
+        """Sort the records of input_path into output_path"""
+        runs = self._create_runs(input_path)
+        self.merge_passes = 0
+        try:
+            if not runs:
+                open(output_path, "wb").close()
+                return None
+
+            while len(runs) > self.fan_in:
+                merged_runs = []
+                for start in range(0, len(runs), self.fan_in):
+                    group = runs[start : start + self.fan_in]
+                    if len(group) == 1:
+                        merged_runs.append(group[0])
+                        continue
+                    path = self._new_run_path()
+                    self._merge(group, path)
+                    for run in group:
+                        os.remove(run)
+                    merged_runs.append(path)
+                runs = merged_runs
+                self.merge_passes += 1
+
+            self._merge(runs, output_path)
+            self.merge_passes += 1
+        finally:
+            for run in runs:
+                if os.path.exists(run):
+                    os.remove(run)
+        return None
+
+
+def main():
+    import random
+
+    record = struct.Struct("<q")
+    values = [random.randint(-(2**63), 2**63 - 1) for _ in range(100_000)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        input_path = os.path.join(directory, "input.bin")
+        output_path = os.path.join(directory, "output.bin")
+        with open(input_path, "wb") as file:
+            file.write(b"".join(map(record.pack, values)))
+
+        # ~1 MB of memory => dozens of runs; fan-in 8 forces an intermediate pass
+        sorter = ExternalSorter("<q", memory_limit=1024 * 1024, fan_in=8)
+        sorter.sort(input_path, output_path)
+
+        with open(output_path, "rb") as file:
+            result = [value for (value,) in record.iter_unpack(file.read())]
+
+    print(f"Chunk size: {sorter.chunk_records} records, merge passes: {sorter.merge_passes}")
+    print(f"First values: {result[:3]}")
+    print(f"Sorted correctly: {result == sorted(values)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,24 +1,97 @@
-from math import floor
+import heapq
+from bisect import bisect_left, bisect_right
+from math import floor, log2
+
+try:
+    import numpy as np
+except ImportError:  # count_sort / radix_sort fall back to pure Python
+    np = None
+
+# -- tuning constants for introsort
+INSERTION_SORT_THRESHOLD = 16  # partitions at most this long are finished by insertion sort
+NINTHER_THRESHOLD = 128  # partitions at least this long use a ninther pivot
+
+# -- tuning constants for selection
+HALVING_PARTITIONS = 3  # partitions allowed to halve the range before a BFPRT pivot
+
+# -- tuning constants for merge sort
+MIN_RUN = 32  # natural runs shorter than this are extended with insertion sort
+MIN_GALLOP = 7  # consecutive wins by one run before switching to galloping
+
+# -- tuning constants for the integer sorts
+RADIX_BITS = 8  # radix sort works one byte (base 256) per pass
+NUMPY_MIN_SIZE = 256  # below this the list <-> ndarray conversion is not worth it
+
+# -- tuning constants for the sort() dispatcher
+SAMPLE_SIZE = 128  # adjacent pairs inspected when profiling the input
+SMALL_ARRAY_SIZE = 32  # at most this many elements => insertion sort
+PRESORTED_RATIO = 0.9  # share of ordered sampled pairs that counts as nearly sorted
+DENSE_RANGE_FACTOR = 2  # (max - min + 1) <= factor * size => counting sort
+RADIX_MAX_BITS = 64  # integers spanning at most this many bits => radix sort
 
 
 class Sorter:
     def __init__(self, array: list):
         self.array = array
         self.size = len(array)
+        self._buffer = None  # auxiliary buffer shared by all merges of one Sorter
+        self.last_decision = None  # filled in by sort()
 
-    def insertion_sort(self, descending=False) -> None:
-        # Assume element at 0 is sorted
+    # -- key= / reverse= support (decorate-sort-undecorate)
+
+    def _sort_decorated(self, algorithm, key, reverse: bool, low: int = 0, high: int = None) -> None:
+        """Run algorithm (a Sorter -> None callable) on array[low..high] by key / reversed
+
+        Each key is computed exactly once into (key, index) pairs; the index breaks
+        ties, so equal keys keep their order and values are never compared. For
+        reverse, the segment is reversed before and after an ascending sort, which
+        keeps equal elements in their original order as well.
+        """
+        if high is None:
+            high = self.size - 1
+        segment = self.array[low : high + 1]
+        if reverse:
+            segment.reverse()
+
+        if key is None:
+            algorithm(Sorter(segment))
+            result = segment
+        else:
+            decorated = Sorter([(k, index) for index, k in enumerate(map(key, segment))])
+            algorithm(decorated)
+            result = [segment[index] for _, index in decorated.array]
+
+        if reverse:
+            result.reverse()
+        self.array[low : high + 1] = result
+        return None
 
-        for index in range(1, self.size):
+    def insertion_sort(self, key=None, reverse=False) -> None:
+        if (key is not None) or reverse:
+            self._sort_decorated(Sorter.insertion_sort, key, reverse)
+            return None
+
+        self._insertion_sort(0, self.size - 1)
+        return None
+
+    def _insertion_sort(self, low: int, high: int) -> None:
+        """Insertion sort restricted to array[low..high]"""
+        # Assume element at low is sorted
+
+        for index in range(low + 1, high + 1):
             element = self.array[index]
             cmp_pointer = index - 1
-            while (element < self.array[cmp_pointer]) and (cmp_pointer >= 0):
+            while (cmp_pointer >= low) and (element < self.array[cmp_pointer]):
                 self.array[cmp_pointer + 1] = self.array[cmp_pointer]
                 cmp_pointer -= 1
             self.array[cmp_pointer + 1] = element
         return None
 
-    def bubble_sort(self, descending=False) -> None:
+    def bubble_sort(self, key=None, reverse=False) -> None:
+        if (key is not None) or reverse:
+            self._sort_decorated(Sorter.bubble_sort, key, reverse)
+            return None
+
         for count in range(1, self.size):
             swap_flag = False
             for index in range(0, self.size - count):
@@ -32,7 +105,11 @@ class Sorter:
                 break
         return None
 
-    def selection_sort(self, descending=False) -> None:
+    def selection_sort(self, key=None, reverse=False) -> None:
+        if (key is not None) or reverse:
+            self._sort_decorated(Sorter.selection_sort, key, reverse)
+            return None
+
         for count in range(0, self.size - 1):
             min_index_yet = count
             for index in range(count + 1, self.size):
@@ -68,6 +145,10 @@ class Sorter:
                     self.array[right_pointer],
                     self.array[left_pointer],
                 )
+                # Both swapped elements are now on the correct side - step past them
+                # (otherwise two elements equal to the pivot are swapped forever)
+                left_pointer += 1
+                right_pointer -= 1
             else:
                 # We have found the partition index
                 break
@@ -79,14 +160,210 @@ class Sorter:
 
         return right_pointer
 
-    def quick_sort(self, low: int, high: int) -> None:
-        """Sort the array using quick sort and partition function"""
-        if low < high:
+    def _median_of_three(self, i: int, j: int, k: int) -> int:
+        """Return the index (among i, j, k) holding the median of the three elements"""
+        a, b, c = self.array[i], self.array[j], self.array[k]
+        if a < b:
+            if b < c:
+                return j
+            return k if a < c else i
+        if a < c:
+            return i
+        return k if b < c else j
+
+    def _select_pivot(self, low: int, high: int) -> None:
+        """Move a median-of-three (or ninther, for long ranges) pivot to array[low]"""
+        mid = (low + high) // 2
+        if high - low + 1 >= NINTHER_THRESHOLD:
+            # Tukey's ninther: median of the medians of three evenly spaced triples
+            step = (high - low + 1) // 8
+            first = self._median_of_three(low, low + step, low + 2 * step)
+            second = self._median_of_three(mid - step, mid, mid + step)
+            third = self._median_of_three(high - 2 * step, high - step, high)
+            pivot_index = self._median_of_three(first, second, third)
+        else:
+            pivot_index = self._median_of_three(low, mid, high)
+
+        self.array[low], self.array[pivot_index] = (
+            self.array[pivot_index],
+            self.array[low],
+        )
+        return None
+
+    # -- helpers for heap sort (introsort fallback)
+
+    def _sift_down(self, low: int, root: int, end: int) -> None:
+        """Restore the max-heap property below root; heap occupies array[low..end]"""
+        while True:
+            child = low + 2 * (root - low) + 1
+            if child > end:
+                break
+            if child + 1 <= end and self.array[child] < self.array[child + 1]:
+                child += 1
+            if self.array[root] < self.array[child]:
+                self.array[root], self.array[child] = self.array[child], self.array[root]
+                root = child
+            else:
+                break
+        return None
+
+    def _heap_sort(self, low: int, high: int) -> None:
+        """Heap sort array[low..high] in place - O(n log n) regardless of input"""
+        for root in range((low + high - 1) // 2, low - 1, -1):
+            self._sift_down(low, root, high)
+
+        for end in range(high, low, -1):
+            self.array[low], self.array[end] = self.array[end], self.array[low]
+            self._sift_down(low, low, end - 1)
+        return None
+
+    def _intro_sort(self, low: int, high: int, depth_limit: int) -> None:
+        """Introsort loop: quick sort, heap sort once too deep, insertion sort when small"""
+        while high - low + 1 > INSERTION_SORT_THRESHOLD:
+            if depth_limit == 0:
+                # Too many unbalanced partitions - switch to guaranteed O(n log n)
+                self._heap_sort(low, high)
+                return None
+            depth_limit -= 1
+
+            self._select_pivot(low, high)
+            partition_index = self._partition(low, high)
+
+            # Recurse into the smaller side and loop on the larger one,
+            # so the stack depth stays O(log n)
+            if partition_index - low < high - partition_index:
+                self._intro_sort(low, partition_index - 1, depth_limit)
+                low = partition_index + 1
+            else:
+                self._intro_sort(partition_index + 1, high, depth_limit)
+                high = partition_index - 1
+
+        self._insertion_sort(low, high)
+        return None
+
+    def quick_sort(self, low: int, high: int, key=None, reverse=False) -> None:
+        """Sort the array using quick sort and partition function (introsort variant)"""
+        if ((key is not None) or reverse) and (low < high):
+            self._sort_decorated(Sorter.intro_sort, key, reverse, low, high)
+        elif low < high:
+            depth_limit = 2 * floor(log2(high - low + 1))
+            self._intro_sort(low, high, depth_limit)
+        return None
+
+    def intro_sort(self, key=None, reverse=False) -> None:
+        """Sort the whole array with introsort - O(n log n) on every input shape"""
+        self.quick_sort(0, self.size - 1, key, reverse)
+        return None
+
+    # -- selection: nth_element, partial_sort, top_k
+
+    def _median_of_medians_pivot(self, low: int, high: int) -> None:
+        """Move the median of the group-of-5 medians to array[low] (BFPRT pivot)"""
+        medians_end = low
+        for group_low in range(low, high + 1, 5):
+            group_high = min(group_low + 4, high)
+            self._insertion_sort(group_low, group_high)
+            median = (group_low + group_high) // 2
+            self.array[medians_end], self.array[median] = (
+                self.array[median],
+                self.array[medians_end],
+            )
+            medians_end += 1
+
+        # medians now sit in array[low..medians_end-1] - select their median
+        mid = (low + medians_end - 1) // 2
+        self._select(low, medians_end - 1, mid)
+        self.array[low], self.array[mid] = self.array[mid], self.array[low]
+        return None
+
+    def _select(self, low: int, high: int, target: int) -> None:
+        """Introselect: quickselect on array[low..high] until array[target] is final.
+        Every HALVING_PARTITIONS partitions must halve the range; if they do not,
+        the next pivot is the median of medians, so the total work stays O(n)"""
+        window_size, partitions = high - low + 1, 0
+        while high > low:
+            if high - low + 1 <= INSERTION_SORT_THRESHOLD:
+                self._insertion_sort(low, high)
+                return None
+            if partitions == HALVING_PARTITIONS:
+                if 2 * (high - low + 1) > window_size:
+                    # Too little progress - median of medians guarantees a 30/70 split
+                    self._median_of_medians_pivot(low, high)
+                else:
+                    self._select_pivot(low, high)
+                window_size, partitions = high - low + 1, 0
+            else:
+                self._select_pivot(low, high)
+            partitions += 1
+
             partition_index = self._partition(low, high)
-            self.quick_sort(low, partition_index - 1)
-            self.quick_sort(partition_index + 1, high)
+            if target == partition_index:
+                return None
+            elif target < partition_index:
+                high = partition_index - 1
+            else:
+                low = partition_index + 1
         return None
 
+    def _sort_positions(self, first: int, last: int) -> None:
+        """Put the elements that belong at positions first..last (in sorted order)
+        there, sorted; everything else only ends up on the correct side"""
+        if first > 0:
+            self._select(0, self.size - 1, first)
+        if last < self.size - 1:
+            self._select(first, self.size - 1, last)
+        self.quick_sort(first, last)
+        return None
+
+    def nth_element(self, n: int, key=None, reverse=False):
+        """Rearrange the array so array[n] is the element a full sort would put there,
+        with no larger element before it and no smaller one after. O(n); returns array[n]
+        """
+        if not 0 <= n < self.size:
+            raise IndexError("Index out of range.")
+        if (key is not None) or reverse:
+            # with reverse, the segment is sorted ascending then flipped, so select the mirror
+            target = self.size - 1 - n if reverse else n
+            self._sort_decorated(
+                lambda sorter: sorter._sort_positions(target, target), key, reverse
+            )
+        else:
+            self._select(0, self.size - 1, n)
+        return self.array[n]
+
+    def partial_sort(self, k: int, key=None, reverse=False) -> None:
+        """Sort only the first k positions (the k smallest, or largest with reverse);
+        the rest is left in unspecified order. O(n + k log k)"""
+        k = min(k, self.size)
+        if k <= 0:
+            return None
+        if (key is not None) or reverse:
+            if reverse:
+                # k largest = the last k positions of the ascending order, flipped to the front
+                algorithm = lambda sorter: sorter._sort_positions(
+                    sorter.size - k, sorter.size - 1
+                )
+            else:
+                algorithm = lambda sorter: sorter._sort_positions(0, k - 1)
+            self._sort_decorated(algorithm, key, reverse)
+        else:
+            self._sort_positions(0, k - 1)
+        return None
+
+    def top_k(self, k: int, key=None, reverse=False) -> list:
+        """The first k elements of the sorted order (k smallest, or largest with
+        reverse), via partial_sort - the array is rearranged in place"""
+        self.partial_sort(k, key, reverse)
+        return self.array[: max(k, 0)]
+
+    @staticmethod
+    def top_k_stream(iterable, k: int, key=None, reverse=False) -> list:
+        """top_k over any iterable (e.g. an unbounded feed) with a heap of at most k
+        items - O(k) memory, O(n log k) time"""
+        if reverse:
+            return heapq.nlargest(k, iterable, key=key)
+        return heapq.nsmallest(k, iterable, key=key)
+
     @staticmethod
     def merge_arrays(array1: list, array2: list) -> list:
         """Merge two sorted arrays into one sorted array"""
@@ -95,12 +372,13 @@ class Sorter:
         index2 = 0
 
         while (index1 < len(array1)) and (index2 < len(array2)):
-            if array1[index1] < array2[index2]:
-                merged_array.append(array1[index1])
-                index1 += 1
-            else:
+            # on ties take from array1 first, so the merge is stable
+            if array2[index2] < array1[index1]:
                 merged_array.append(array2[index2])
                 index2 += 1
+            else:
+                merged_array.append(array1[index1])
+                index1 += 1
 
         if index1 == len(array1):
             merged_array.extend(array2[index2:])
@@ -109,19 +387,188 @@ class Sorter:
 
         return merged_array
 
+    @staticmethod
+    def merge_k_arrays(arrays: list) -> list:
+        """Merge k sorted arrays into one sorted array (log2(k) rounds of merge_arrays)"""
+        if not arrays:
+            return []
+
+        while len(arrays) > 1:
+            arrays = [
+                Sorter.merge_arrays(arrays[index], arrays[index + 1])
+                if index + 1 < len(arrays)
+                else arrays[index]
+                for index in range(0, len(arrays), 2)
+            ]
+        return arrays[0]
+
+    @staticmethod
+    def merge_iterables(*iterables, key=None, reverse=False):
+        """Lazily merge any number of sorted iterables (generator, O(k) memory)
+
+        A loser tree picks the next element in log2(k) comparisons; ties go to the
+        earlier iterable, so the merge is stable. Each key is computed once. After
+        one input wins MIN_GALLOP times in a row, it gallops: its elements are
+        emitted with one comparison each against the runner-up, skipping the tree
+        until it loses. With reverse, the inputs must be sorted in descending order.
+        """
+        sources = [iter(iterable) for iterable in iterables]
+        count = len(sources)
+        if count == 0:
+            return
+        head_keys = [None] * count
+        head_values = [None] * count
+        alive = [False] * count
+
+        def advance(source: int) -> None:
+            for value in sources[source]:
+                head_values[source] = value
+                head_keys[source] = value if key is None else key(value)
+                return None
+            alive[source] = False
+            head_values[source] = head_keys[source] = None
+            return None
+
+        def beats(first: int, second: int) -> bool:
+            """Does the head of source first come out before the head of second?"""
+            if not alive[first]:
+                return False
+            if not alive[second]:
+                return True
+            key1, key2 = head_keys[first], head_keys[second]
+            if reverse:
+                key1, key2 = key2, key1
+            if key1 < key2:
+                return True
+            return (first < second) and not (key2 < key1)
+
+        # -- loser tree: leaves are nodes count..2*count-1, losers[node] for 1..count-1
+        losers = [None] * count
+
+        def build(node: int) -> int:
+            if node >= count:
+                return node - count
+            left, right = build(2 * node), build(2 * node + 1)
+            if beats(left, right):
+                losers[node] = right
+                return left
+            losers[node] = left
+            return right
+
+        def replay(source: int) -> int:
+            """Re-run the matches from leaf source to the root, return the new winner"""
+            node = (source + count) // 2
+            while node >= 1:
+                if beats(losers[node], source):
+                    losers[node], source = source, losers[node]
+                node //= 2
+            return source
+
+        for source in range(count):
+            alive[source] = True
+            advance(source)
+        winner = build(1)
+
+        previous, streak = None, 0
+        while alive[winner]:
+            yield head_values[winner]
+            streak = streak + 1 if winner == previous else 1
+            previous = winner
+            advance(winner)
+
+            if streak >= MIN_GALLOP:
+                # runner-up = best loser on the winner's path; nothing else changes
+                # while the winner keeps winning, so no replays are needed
+                runner = None
+                node = (winner + count) // 2
+                while node >= 1:
+                    if (runner is None) or beats(losers[node], runner):
+                        runner = losers[node]
+                    node //= 2
+                while alive[winner] and ((runner is None) or beats(winner, runner)):
+                    yield head_values[winner]
+                    advance(winner)
+                streak = 0
+
+            winner = replay(winner)
+
+    # -- helpers for merge sort
+
+    def _merge_buffer(self) -> list:
+        """Return the single auxiliary list used by every merge (allocated once)"""
+        if self._buffer is None or len(self._buffer) != self.size:
+            self._buffer = [None] * self.size
+        return self._buffer
+
+    @staticmethod
+    def _merge_runs(src: list, dst: list, low: int, mid: int, high: int) -> None:
+        """Stable merge of src[low..mid] and src[mid+1..high] into dst[low..high]
+
+        Once one run wins MIN_GALLOP comparisons in a row, the rest of its winning
+        stretch is located by binary search and block-copied (galloping).
+        """
+        if src[mid] <= src[mid + 1]:
+            # Runs are already in order - nothing to interleave
+            dst[low : high + 1] = src[low : high + 1]
+            return None
+
+        index1, end1 = low, mid + 1
+        index2, end2 = mid + 1, high + 1
+        out = low
+        wins1 = wins2 = 0
+
+        while (index1 < end1) and (index2 < end2):
+            if src[index2] < src[index1]:
+                dst[out] = src[index2]
+                index2 += 1
+                out += 1
+                wins2 += 1
+                wins1 = 0
+                if wins2 >= MIN_GALLOP:
+                    # Everything in run 2 strictly below src[index1] comes next
+                    stop = bisect_left(src, src[index1], index2, end2)
+                    dst[out : out + stop - index2] = src[index2:stop]
+                    out += stop - index2
+                    index2 = stop
+                    wins2 = 0
+            else:
+                dst[out] = src[index1]
+                index1 += 1
+                out += 1
+                wins1 += 1
+                wins2 = 0
+                if wins1 >= MIN_GALLOP and index2 < end2:
+                    # Run 1 elements equal to src[index2] stay first (stability)
+                    stop = bisect_right(src, src[index2], index1, end1)
+                    dst[out : out + stop - index1] = src[index1:stop]
+                    out += stop - index1
+                    index1 = stop
+                    wins1 = 0
+
+        if index1 < end1:
+            dst[out : high + 1] = src[index1:end1]
+        else:
+            dst[out : high + 1] = src[index2:end2]
+        return None
+
     def merge_in_place(self, low: int, mid: int, high: int) -> None:
-        merged_array = self.merge_arrays(
-            self.array[low : mid + 1], self.array[mid + 1 : high + 1]
-        )
+        if self.array[mid] <= self.array[mid + 1]:
+            return None
 
-        m_index = 0
-        for index in range(low, high + 1):
-            self.array[index] = merged_array[m_index]
-            m_index += 1
+        buffer = self._merge_buffer()
+        buffer[low : high + 1] = self.array[low : high + 1]
+        self._merge_runs(buffer, self.array, low, mid, high)
 
         return None
 
-    def iterative_merge_sort(self) -> None:
+    def iterative_merge_sort(self, key=None, reverse=False) -> None:
+        if (key is not None) or reverse:
+            self._sort_decorated(Sorter.iterative_merge_sort, key, reverse)
+            return None
+
+        # Each pass merges from src into dst, then the two buffers swap roles (ping-pong),
+        # so there is no copy-back per merge
+        src, dst = self.array, self._merge_buffer()
         # codify the length of sub-array to be merged in each pass by a parameter called sub_array_size, initialized to 1
         sub_array_size = 1
         # we have to run the merging step till the size of the sub-array exceeds the length of the original array
@@ -134,13 +581,86 @@ class Sorter:
                 high = min(low + 2 * sub_array_size - 1, self.size - 1)
 
                 if mid < high:
-                    self.merge_in_place(low, mid, high)
+                    self._merge_runs(src, dst, low, mid, high)
+                else:
+                    # unpaired trailing sub-array - carry it over to dst unchanged
+                    dst[low : high + 1] = src[low : high + 1]
+            src, dst = dst, src
             sub_array_size = 2 * sub_array_size
+
+        if src is not self.array:
+            self.array[:] = src
+        return None
+
+    def _find_runs(self) -> list:
+        """Split the array into ascending runs and return their boundaries
+
+        Strictly descending runs are reversed in place; runs shorter than MIN_RUN
+        are extended with insertion sort. Returns [0, end_1, end_2, ..., size].
+        """
+        boundaries = [0]
+        index = 0
+        while index < self.size:
+            start = index
+            index += 1
+            if (index < self.size) and (self.array[index] < self.array[index - 1]):
+                # strictly descending (so reversing keeps equal elements in order)
+                while (index < self.size) and (self.array[index] < self.array[index - 1]):
+                    index += 1
+                self.array[start:index] = self.array[start:index][::-1]
+            else:
+                while (index < self.size) and (self.array[index] >= self.array[index - 1]):
+                    index += 1
+
+            if (index - start < MIN_RUN) and (index < self.size):
+                index = min(start + MIN_RUN, self.size)
+                self._insertion_sort(start, index - 1)
+            boundaries.append(index)
+        return boundaries
+
+    def merge_sort(self, key=None, reverse=False) -> None:
+        """Natural merge sort: merge the existing runs pairwise, ping-ponging between
+        the array and one auxiliary buffer. O(n) on sorted / reversed input."""
+        if self.size < 2:
+            return None
+        if (key is not None) or reverse:
+            self._sort_decorated(Sorter.merge_sort, key, reverse)
+            return None
+
+        boundaries = self._find_runs()
+        src, dst = self.array, self._merge_buffer()
+        while len(boundaries) > 2:
+            merged_boundaries = [0]
+            for pair in range(0, len(boundaries) - 1, 2):
+                low = boundaries[pair]
+                if pair + 2 < len(boundaries):
+                    mid = boundaries[pair + 1] - 1
+                    high = boundaries[pair + 2] - 1
+                    self._merge_runs(src, dst, low, mid, high)
+                else:
+                    high = boundaries[pair + 1] - 1
+                    dst[low : high + 1] = src[low : high + 1]
+                merged_boundaries.append(high + 1)
+            boundaries = merged_boundaries
+            src, dst = dst, src
+
+        if src is not self.array:
+            self.array[:] = src
         return None
 
     def recursive_merge_sort(
-        self, low: int, high: int
+        self, low: int, high: int, key=None, reverse=False
     ) -> None:  # Top down since recursion
+        if ((key is not None) or reverse) and (low < high):
+            self._sort_decorated(
+                lambda sorter: sorter.recursive_merge_sort(0, sorter.size - 1),
+                key,
+                reverse,
+                low,
+                high,
+            )
+            return None
+
         if low == high:
             # array of 1 element => sorted
             return None
@@ -158,42 +678,272 @@ class Sorter:
             self.merge_in_place(low, mid, high)
             return None
 
-    def count_sort(self) -> None:
+    # -- helpers for the integer sorts
+
+    def _as_int64_array(self, values=None):
+        """Return values (default: the array) as an int64 ndarray, or None if NumPy
+        cannot be used"""
+        if values is None:
+            values = self.array
+        if (np is None) or (self.size < NUMPY_MIN_SIZE):
+            return None
+        try:
+            values = np.asarray(values)
+        except OverflowError:
+            return None
+        if values.dtype != np.int64:
+            # floats, objects or Python ints outside the int64 range
+            return None
+        return values
+
+    def _write_back(self, values) -> None:
+        """Copy a sorted ndarray back into self.array"""
+        if isinstance(self.array, list):
+            self.array[:] = values.tolist()
+        else:
+            self.array[:] = values
+        return None
+
+    def _reverse_array(self) -> None:
+        self.array[:] = self.array[::-1]
+        return None
+
+    def count_sort(self, key=None, reverse=False) -> None:
+        """Counting sort of integers (or integer keys); the table is offset by the
+        minimum so it has (max - min + 1) slots and negative values are allowed"""
+        if self.size == 0:
+            return None
+        if reverse:
+            # reverse - sort - reverse keeps equal keys in their original order
+            self._reverse_array()
+            self.count_sort(key)
+            self._reverse_array()
+            return None
+        if key is not None:
+            self._count_sort_by_key([key(element) for element in self.array])
+            return None
+
+        values = self._as_int64_array()
+        if values is not None:
+            min_element = values.min()
+            count_array = np.bincount(values - min_element)
+            self._write_back(
+                np.repeat(np.arange(min_element, min_element + len(count_array)), count_array)
+            )
+            return None
+
+        min_element = min(self.array)
         max_element = max(self.array)
-        count_array = [0]*(max_element+1)
+        count_array = [0] * (max_element - min_element + 1)
 
         for element in self.array:
-            count_array[element] += 1
+            count_array[element - min_element] += 1
 
         main_index = 0
         for index, count in enumerate(count_array):
-            while count >0:
-                self.array[main_index] = index
-                main_index += 1
-                count -= 1
+            if count > 0:
+                self.array[main_index : main_index + count] = [index + min_element] * count
+                main_index += count
 
         del count_array
         return None
 
-    def radix_sort(self) -> None:
-        max_element = max(self.array)
+    def _count_sort_by_key(self, keys: list) -> None:
+        """Stable counting sort of the array by precomputed integer keys"""
+        min_key = min(keys)
+        count_array = [0] * (max(keys) - min_key + 1)
+        for k in keys:
+            count_array[k - min_key] += 1
+
+        # exclusive prefix sum: count_array[k] becomes the first output slot of key k
+        total = 0
+        for index in range(len(count_array)):
+            count_array[index], total = total, total + count_array[index]
+
+        output = self._merge_buffer()
+        for k, element in zip(keys, self.array):
+            output[count_array[k - min_key]] = element
+            count_array[k - min_key] += 1
+
+        self.array[:] = output
+        del count_array
+        return None
+
+    def _radix_order_numpy(self, keys):
+        """Byte-wise LSD radix sort of an int64 ndarray; returns the sorting permutation"""
+        min_key = keys.min()
+        # Shift into [0, max - min] as uint64 (wrap-around arithmetic keeps it exact)
+        keys = keys.view(np.uint64) - np.uint64(int(min_key) & 0xFFFFFFFFFFFFFFFF)
+        span = int(keys.max())
+        order = np.arange(self.size)
+
+        shift = 0
+        while span >> shift:
+            digits = ((keys >> np.uint64(shift)) & np.uint64(0xFF)).astype(np.uint8)
+            if np.bincount(digits, minlength=256).max() < self.size:
+                # NumPy's stable sort of uint8 is itself a counting sort + scatter
+                pass_order = np.argsort(digits, kind="stable")
+                keys = keys[pass_order]
+                order = order[pass_order]
+            shift += RADIX_BITS
+
+        return order
+
+    def _radix_sort_python(self, keys: list, values: list) -> list:
+        """Byte-wise LSD radix sort of integer keys, moving values (if given) in
+        lockstep; returns the sorted values (or keys)"""
+        min_key = min(keys)
+        span = max(keys) - min_key
+        radix = 1 << RADIX_BITS
+        mask = radix - 1
 
-        divisor = 1
-        while(max_element//divisor >0):
-            radix_array = [[] for _ in range(10)]
-            for element in self.array:
-                radix_array[(element//divisor)%10].append(element)
+        src_keys, dst_keys = keys, [None] * self.size
+        if values is not None:
+            src_values, dst_values = values, [None] * self.size
+        shift = 0
+        while span >> shift:
+            count_array = [0] * radix
+            for k in src_keys:
+                count_array[((k - min_key) >> shift) & mask] += 1
 
-            main_index = 0
-            for element_list in radix_array:
-                for element in element_list:
-                    self.array[main_index] = element
-                    main_index += 1
+            if max(count_array) < self.size:  # otherwise every key shares this byte
+                # exclusive prefix sum: count_array[digit] becomes the first output slot
+                total = 0
+                for digit in range(radix):
+                    count_array[digit], total = total, total + count_array[digit]
 
-            divisor = divisor*10
+                if values is None:
+                    for k in src_keys:
+                        digit = ((k - min_key) >> shift) & mask
+                        dst_keys[count_array[digit]] = k
+                        count_array[digit] += 1
+                else:
+                    for k, element in zip(src_keys, src_values):
+                        digit = ((k - min_key) >> shift) & mask
+                        dst_keys[count_array[digit]] = k
+                        dst_values[count_array[digit]] = element
+                        count_array[digit] += 1
+                    src_values, dst_values = dst_values, src_values
+                src_keys, dst_keys = dst_keys, src_keys
 
+            shift += RADIX_BITS
+
+        return src_keys if values is None else src_values
+
+    def radix_sort(self, key=None, reverse=False) -> None:
+        """LSD radix sort of integers (or integer keys), one byte (base 256) per pass.
+
+        Each pass counts the byte values, turns the counts into start offsets with a
+        prefix sum and scatters into the other buffer. Keys are offset by the
+        minimum, so negative and 64-bit (or wider) integers are handled.
+        """
+        if self.size < 2:
+            return None
+        if reverse:
+            # reverse - sort - reverse keeps equal keys in their original order
+            self._reverse_array()
+            self.radix_sort(key)
+            self._reverse_array()
+            return None
+
+        keys = self.array if key is None else [key(element) for element in self.array]
+        key_array = self._as_int64_array(keys)
+        if key_array is not None:
+            order = self._radix_order_numpy(key_array)
+            if key is None:
+                self._write_back(key_array[order])
+            else:
+                values = self.array[:]
+                self.array[:] = [values[index] for index in order.tolist()]
+            return None
+
+        if key is None:
+            self.array[:] = self._radix_sort_python(self.array, None)
+        else:
+            self.array[:] = self._radix_sort_python(keys, self.array)
         return None
 
+    # -- adaptive dispatcher
+
+    def profile(self, key=None) -> dict:
+        """Cheap profile of the input from SAMPLE_SIZE evenly spaced adjacent pairs
+
+        presortedness (share of ascending / descending pairs), duplicate ratio and
+        whether the sampled values are integers. With no key, integer-looking input
+        is confirmed (and its exact range measured) by three O(n) builtin passes -
+        all(), max() and min(); with a key that would cost n extra key calls, so
+        keyed sorts skip the integer paths.
+        """
+        profile = {
+            "size": self.size,
+            "ascending_ratio": 1.0,
+            "descending_ratio": 1.0,
+            "duplicate_ratio": 0.0,
+            "integers": False,
+            "value_range": None,
+        }
+        if self.size < 2:
+            return profile
+
+        step = max(1, (self.size - 1) // SAMPLE_SIZE)
+        positions = range(0, self.size - 1, step)
+        get = (
+            (lambda index: self.array[index])
+            if key is None
+            else (lambda index: key(self.array[index]))
+        )
+        pairs = [(get(index), get(index + 1)) for index in positions]
+        sample = [first for first, _ in pairs]
+
+        profile["ascending_ratio"] = sum(
+            first <= second for first, second in pairs
+        ) / len(pairs)
+        profile["descending_ratio"] = sum(
+            first >= second for first, second in pairs
+        ) / len(pairs)
+        try:
+            profile["duplicate_ratio"] = 1 - len(set(sample)) / len(sample)
+        except TypeError:  # unhashable values
+            pass
+
+        if (key is None) and all(type(value) is int for value in sample):
+            if all(type(value) is int for value in self.array):
+                profile["integers"] = True
+                profile["value_range"] = max(self.array) - min(self.array) + 1
+        return profile
+
+    def sort(self, key=None, reverse=False) -> dict:
+        """Profile the input, run the algorithm that suits it and return the decision
+        (the profile plus "algorithm" and "reason") - also kept in self.last_decision"""
+        decision = self.profile(key)
+        ascending = decision["ascending_ratio"]
+        descending = decision["descending_ratio"]
+        value_range = decision["value_range"]
+
+        if self.size <= SMALL_ARRAY_SIZE:
+            algorithm, reason = "insertion_sort", "short array"
+        elif max(ascending, descending) >= PRESORTED_RATIO:
+            algorithm, reason = "merge_sort", "nearly sorted - natural runs"
+        elif decision["integers"] and (
+            value_range <= DENSE_RANGE_FACTOR * self.size
+            or (
+                decision["duplicate_ratio"] >= 0.5
+                and value_range <= 4 * DENSE_RANGE_FACTOR * self.size
+            )
+        ):
+            algorithm, reason = "count_sort", "integers in a dense range"
+        elif decision["integers"] and (value_range - 1).bit_length() <= RADIX_MAX_BITS:
+            algorithm, reason = "radix_sort", "bounded-width integers"
+        else:
+            algorithm, reason = "intro_sort", "general input"
+
+        decision["algorithm"] = algorithm
+        decision["reason"] = reason
+        self.last_decision = decision
+
+        getattr(self, algorithm)(key=key, reverse=reverse)
+        return decision
+
     def __len__(self):
         return self.size
 
@@ -236,7 +986,12 @@ def main():
 
     obj = Sorter(array)
     print(f"Gonna do Recursive Merge sort on {obj}")
-    obj.recursive_merge_sort(0,obj.size-1)
+    obj.recursive_merge_sort(0, obj.size - 1)
+    print(obj)
+
+    obj = Sorter(array)
+    print(f"Gonna do Natural Merge sort on {obj}")
+    obj.merge_sort()
     print(obj)
 
     obj = Sorter(array)
@@ -249,4 +1004,28 @@ def main():
     obj.radix_sort()
     print(obj)
 
-main()
+    records = [("carol", 31), ("alice", 25), ("bob", 31), ("dave", 25)]
+    obj = Sorter(records)
+    print(f"Gonna do Merge sort by age, oldest first, on {obj}")
+    obj.merge_sort(key=lambda record: record[1], reverse=True)
+    print(obj)
+
+    obj = Sorter([(index * 37) % 101 for index in range(1000)])
+    decision = obj.sort()
+    print(f"sort() picked {decision['algorithm']} ({decision['reason']})")
+
+    shards = [[1, 4, 9], [2, 3, 10, 11], [], [5, 6, 7, 8]]
+    print(f"Lazy merge of {shards}: {list(Sorter.merge_iterables(*shards))}")
+
+    obj = Sorter([12, 4, 7, 1, 0, 2, 4, 15, 9])
+    print(f"Median of {obj} is {obj.nth_element(obj.size // 2)}")
+    print(f"Three largest: {obj.top_k(3, reverse=True)}")
+
+    obj = Sorter([3, -7, 2**40, 0, -(2**40), 5, -7])
+    print(f"Gonna do Radix sort (negative / wide values) on {obj}")
+    obj.radix_sort()
+    print(obj)
+
+
+if __name__ == "__main__":
+    main()